@@ -5,7 +5,8 @@ Provides methods for generating secure, time-limited URLs for downloading
 de-identified DICOM files from S3.
 """
 
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
 
 import boto3
 from botocore.exceptions import ClientError
@@ -24,6 +25,7 @@ class PresignedUrlHandler:
         region_name: str = "us-east-1",
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
+        s3_client: Optional[Any] = None,
     ) -> None:
         """
         Initialize PresignedUrlHandler.
@@ -33,16 +35,21 @@ class PresignedUrlHandler:
             region_name: AWS region name
             aws_access_key_id: Optional AWS access key ID
             aws_secret_access_key: Optional AWS secret access key
+            s3_client: Pre-built S3 client to use instead of creating one
         """
         self.bucket_name = bucket_name
         self.region_name = region_name
 
-        session_kwargs = {"region_name": region_name}
-        if aws_access_key_id and aws_secret_access_key:
-            session_kwargs["aws_access_key_id"] = aws_access_key_id
-            session_kwargs["aws_secret_access_key"] = aws_secret_access_key
+        # Initialize S3 client unless one was injected
+        if s3_client is None:
+            session_kwargs = {"region_name": region_name}
+            if aws_access_key_id and aws_secret_access_key:
+                session_kwargs["aws_access_key_id"] = aws_access_key_id
+                session_kwargs["aws_secret_access_key"] = aws_secret_access_key
 
-        self.s3_client = boto3.client("s3", **session_kwargs)
+            s3_client = boto3.client("s3", **session_kwargs)
+
+        self.s3_client = s3_client
 
         log_execution(
             logger,
@@ -208,13 +215,17 @@ class PresignedUrlHandler:
         self,
         object_keys: list[str],
         expiration_seconds: int = 3600,
+        max_workers: int = 8,
     ) -> Dict[str, Dict[str, str]]:
         """
         Generate presigned URLs for multiple files.
 
+        Keys are signed concurrently on a thread pool; results keep input order.
+
         Args:
             object_keys: List of S3 object keys
             expiration_seconds: URL expiration time in seconds
+            max_workers: Maximum number of signing threads
 
         Returns:
             Dict mapping object_key to presigned URL info dict
@@ -229,12 +240,19 @@ class PresignedUrlHandler:
         results = {}
         failed_keys = []
 
-        for object_key in object_keys:
-            try:
-                url_info = self.generate_download_url(
-                    object_key=object_key, expiration_seconds=expiration_seconds
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(object_keys)))) as pool:
+            futures = {
+                object_key: pool.submit(
+                    self.generate_download_url,
+                    object_key=object_key,
+                    expiration_seconds=expiration_seconds,
                 )
-                results[object_key] = url_info
+                for object_key in object_keys
+            }
+
+        for object_key, future in futures.items():
+            try:
+                results[object_key] = future.result()
             except ClientError as e:
                 logger.warning(
                     f"Failed to generate URL for {object_key}: {str(e)}",
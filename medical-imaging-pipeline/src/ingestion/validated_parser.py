@@ -155,8 +155,7 @@ class ValidatedDICOMParser:
             )
 
         # Build modality-specific metadata
-        ct_metadata = None
-        mr_metadata = None
+        modality_metadata = None
 
         if metadata.get("modality") == "CT":
             # Only create CT metadata if at least one CT-specific field has a value
@@ -164,7 +163,7 @@ class ValidatedDICOMParser:
                 metadata.get(k) is not None
                 for k in ["kvp", "slice_thickness", "reconstruction_diameter"]
             ):
-                ct_metadata = CTMetadataSchema(
+                modality_metadata = CTMetadataSchema(
                     kvp=metadata.get("kvp"),
                     slice_thickness=metadata.get("slice_thickness"),
                     reconstruction_diameter=metadata.get("reconstruction_diameter"),
@@ -176,21 +175,20 @@ class ValidatedDICOMParser:
                 metadata.get(k) is not None
                 for k in ["repetition_time", "echo_time", "magnetic_field_strength"]
             ):
-                mr_metadata = MRMetadataSchema(
+                modality_metadata = MRMetadataSchema(
                     repetition_time=metadata.get("repetition_time"),
                     echo_time=metadata.get("echo_time"),
                     magnetic_field_strength=metadata.get("magnetic_field_strength"),
                 )
 
-        # Combine into complete schema
-        validated_metadata = DICOMMetadataSchema(
+        # Combine into complete schema; sub-schemas above are already validated
+        validated_metadata = DICOMMetadataSchema.assemble(
             patient=patient,
             study=study,
             series=series,
             instance=instance,
             image=image,
-            ct_metadata=ct_metadata,
-            mr_metadata=mr_metadata,
+            modality_metadata=modality_metadata,
         )
 
         return validated_metadata
@@ -238,8 +236,8 @@ class ValidatedDICOMParser:
             instance_number=metadata.get("instance_number"),
         )
 
-        # Build complete schema
-        validated = DICOMMetadataSchema(
+        # Build complete schema; sub-schemas above are already validated
+        validated = DICOMMetadataSchema.assemble(
             patient=patient,
             study=study,
             series=series,
@@ -5,6 +5,7 @@ Provides methods for managing Step Functions state machines and executions.
 """
 
 import json
+import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -13,8 +14,16 @@ from botocore.exceptions import ClientError
 
 from utils.logger import get_logger, log_execution
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to the stdlib parser
+    orjson = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
+# ${VariableName} placeholder used in state machine definition templates
+_PLACEHOLDER_RE = re.compile(r"\$\{([^}]+)\}")
+
 
 class StepFunctionsHandler:
     """
@@ -28,6 +37,7 @@ class StepFunctionsHandler:
         region_name: str = "us-east-1",
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
+        sfn_client: Optional[Any] = None,
     ) -> None:
         """
         Initialize Step Functions handler.
@@ -36,16 +46,20 @@ class StepFunctionsHandler:
             region_name: AWS region (default: us-east-1)
             aws_access_key_id: AWS access key (optional)
             aws_secret_access_key: AWS secret key (optional)
+            sfn_client: Pre-built Step Functions client to use instead of creating one
         """
         self.region_name = region_name
 
-        # Initialize Step Functions client
-        session_kwargs = {"region_name": region_name}
-        if aws_access_key_id and aws_secret_access_key:
-            session_kwargs["aws_access_key_id"] = aws_access_key_id
-            session_kwargs["aws_secret_access_key"] = aws_secret_access_key
+        # Initialize Step Functions client unless one was injected
+        if sfn_client is None:
+            session_kwargs = {"region_name": region_name}
+            if aws_access_key_id and aws_secret_access_key:
+                session_kwargs["aws_access_key_id"] = aws_access_key_id
+                session_kwargs["aws_secret_access_key"] = aws_secret_access_key
+
+            sfn_client = boto3.client("stepfunctions", **session_kwargs)
 
-        self.sfn_client = boto3.client("stepfunctions", **session_kwargs)
+        self.sfn_client = sfn_client
 
     def create_state_machine(
         self,
@@ -495,6 +509,10 @@ class StepFunctionsHandler:
         if not path.exists():
             raise FileNotFoundError(f"State machine definition not found: {file_path}")
 
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers see one error type
+        if orjson is not None:
+            return orjson.loads(path.read_bytes())
+
         with open(path, "r") as f:
             definition = json.load(f)
 
@@ -515,13 +533,19 @@ class StepFunctionsHandler:
         Returns:
             Definition with substituted variables
         """
-        # Convert to JSON string
-        definition_str = json.dumps(definition)
-
-        # Substitute each variable
-        for var_name, var_value in variables.items():
-            placeholder = f"${{{var_name}}}"
-            definition_str = definition_str.replace(placeholder, var_value)
 
-        # Convert back to dict
-        return json.loads(definition_str)
+        def replace(match: "re.Match[str]") -> str:
+            # Unknown placeholders are left untouched
+            return variables.get(match.group(1), match.group(0))
+
+        def substitute(value: Any) -> Any:
+            if isinstance(value, str):
+                return _PLACEHOLDER_RE.sub(replace, value)
+            if isinstance(value, dict):
+                return {substitute(key): substitute(item) for key, item in value.items()}
+            if isinstance(value, list):
+                return [substitute(item) for item in value]
+            return value
+
+        # Single pass over the tree, one regex scan per string
+        return substitute(definition)
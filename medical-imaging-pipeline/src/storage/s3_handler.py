@@ -7,9 +7,10 @@ listing, and presigned URL generation.
 
 import hashlib
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, BinaryIO, Dict, List, Optional, Union
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
 from utils.logger import get_logger, log_execution
@@ -31,6 +32,7 @@ class S3Handler:
         region_name: str = "us-east-1",
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
+        config: Optional[Config] = None,
     ) -> None:
         """
         Initialize S3 handler.
@@ -40,15 +42,18 @@ class S3Handler:
             region_name: AWS region (default: us-east-1)
             aws_access_key_id: AWS access key (optional, uses default credentials if None)
             aws_secret_access_key: AWS secret key (optional, uses default credentials if None)
+            config: Optional botocore client config (retries, timeouts, signature version)
         """
         self.bucket_name = bucket_name
         self.region_name = region_name
 
         # Initialize S3 client
-        session_kwargs = {"region_name": region_name}
+        session_kwargs: Dict[str, Any] = {"region_name": region_name}
         if aws_access_key_id and aws_secret_access_key:
             session_kwargs["aws_access_key_id"] = aws_access_key_id
             session_kwargs["aws_secret_access_key"] = aws_secret_access_key
+        if config is not None:
+            session_kwargs["config"] = config
 
         self.s3_client = boto3.client("s3", **session_kwargs)
         self.s3_resource = boto3.resource("s3", **session_kwargs)
@@ -77,31 +82,68 @@ class S3Handler:
             NoCredentialsError: If AWS credentials not found
             ClientError: If S3 upload fails
         """
+        local_path = Path(local_path)
+        if not local_path.exists():
+            error = FileNotFoundError(f"Local file not found: {local_path}")
+            log_execution(
+                logger,
+                operation="upload_file",
+                status="failed",
+                details={"s3_key": s3_key, "local_path": str(local_path)},
+                error=error,
+            )
+            raise error
+
+        with open(local_path, "rb") as f:
+            return self.upload_fileobj(f, s3_key, metadata=metadata, content_type=content_type)
+
+    def upload_fileobj(
+        self,
+        fileobj: BinaryIO,
+        s3_key: str,
+        metadata: Optional[Dict[str, str]] = None,
+        content_type: str = "application/dicom",
+    ) -> Dict[str, Any]:
+        """
+        Upload file-like object to S3.
+
+        Reads from the current stream position, so in-memory buffers can be
+        uploaded without first being written to disk.
+
+        Args:
+            fileobj: Readable binary file-like object (must be seekable)
+            s3_key: S3 object key (path in bucket)
+            metadata: Optional metadata to attach
+            content_type: MIME type (default: application/dicom)
+
+        Returns:
+            Dictionary with upload results including ETag and size
+
+        Raises:
+            NoCredentialsError: If AWS credentials not found
+            ClientError: If S3 upload fails
+        """
         log_execution(
             logger,
-            operation="upload_file",
+            operation="upload_fileobj",
             status="started",
-            details={"s3_key": s3_key, "local_path": str(local_path)},
+            details={"s3_key": s3_key},
         )
 
         try:
-            local_path = Path(local_path)
-            if not local_path.exists():
-                raise FileNotFoundError(f"Local file not found: {local_path}")
-
-            # Calculate file checksum
-            file_hash = self._calculate_file_hash(local_path)
-            file_size = local_path.stat().st_size
+            # Calculate checksum and size, then rewind for the upload
+            start = fileobj.tell()
+            file_hash = self._calculate_fileobj_hash(fileobj)
+            file_size = fileobj.tell() - start
+            fileobj.seek(start)
 
             # Prepare extra args
             extra_args = {"ContentType": content_type}
             if metadata:
                 extra_args["Metadata"] = metadata
 
-            # Upload file
-            self.s3_client.upload_file(
-                str(local_path), self.bucket_name, s3_key, ExtraArgs=extra_args
-            )
+            # Upload file object
+            self.s3_client.upload_fileobj(fileobj, self.bucket_name, s3_key, ExtraArgs=extra_args)
 
             # Get object metadata
             response = self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
@@ -117,7 +159,7 @@ class S3Handler:
 
             log_execution(
                 logger,
-                operation="upload_file",
+                operation="upload_fileobj",
                 status="completed",
                 details={
                     "s3_key": s3_key,
@@ -128,10 +170,10 @@ class S3Handler:
 
             return result
 
-        except (FileNotFoundError, NoCredentialsError, ClientError) as e:
+        except (NoCredentialsError, ClientError) as e:
             log_execution(
                 logger,
-                operation="upload_file",
+                operation="upload_fileobj",
                 status="failed",
                 details={"s3_key": s3_key},
                 error=e,
@@ -424,8 +466,20 @@ class S3Handler:
         Returns:
             MD5 hash as hex string
         """
-        md5_hash = hashlib.md5()
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                md5_hash.update(chunk)
+            return self._calculate_fileobj_hash(f)
+
+    def _calculate_fileobj_hash(self, fileobj: BinaryIO) -> str:
+        """
+        Calculate MD5 hash of file-like object from its current position.
+
+        Args:
+            fileobj: Readable binary file-like object
+
+        Returns:
+            MD5 hash as hex string
+        """
+        md5_hash = hashlib.md5()
+        for chunk in iter(lambda: fileobj.read(8192), b""):
+            md5_hash.update(chunk)
         return md5_hash.hexdigest()
@@ -6,21 +6,59 @@ and delivery packages with comprehensive validation rules.
 """
 
 import re
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-from pydantic import BaseModel, Field, field_validator, model_validator
+from collections.abc import Sequence
+from typing import Annotated, Any, Dict, List, Literal, Optional, Tuple, Union
+
+from pydantic import (
+    BaseModel,
+    Field,
+    StringConstraints,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
 
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Patterns compiled once at import rather than on every validator call
+_ISO8601_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:\d{2})")
+
+# Translation table deleting every character allowed in a DICOM UID
+_UID_CHARS_DELETE = str.maketrans("", "", "0123456789.")
+
+# Hex digest lengths for MD5, SHA-1, SHA-256 and SHA-512
+_VALID_CHECKSUM_LENGTHS = frozenset({32, 40, 64, 128})
+
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _is_valid_date(year: int, month: int, day: int) -> bool:
+    """Check a calendar date without building a datetime object."""
+    if year < 1 or not 1 <= month <= 12 or day < 1:
+        return False
+    if month == 2 and (year % 4 == 0 and year % 100 != 0 or year % 400 == 0):
+        return day <= 29
+    return day <= _DAYS_IN_MONTH[month - 1]
+
+
+def _validate_uid(v: str, label: str) -> str:
+    """Validate UID follows DICOM format (numeric components separated by dots)."""
+    if v.translate(_UID_CHARS_DELETE):
+        raise ValueError(f"{label} must contain only digits and dots")
+    if v.startswith(".") or v.endswith(".") or ".." in v:
+        raise ValueError(f"{label} has invalid dot placement")
+    return v
+
 
 class PatientSchema(BaseModel):
     """Schema for patient information (de-identified)."""
 
-    patient_id: str = Field(..., min_length=1, max_length=64, description="Hashed patient ID")
-    patient_sex: Optional[str] = Field(None, pattern="^[MFO]$", description="Patient sex")
+    patient_id: Annotated[str, StringConstraints(strip_whitespace=True, max_length=64)] = Field(
+        ..., description="Hashed patient ID"
+    )
+    patient_sex: Optional[Literal["M", "F", "O"]] = Field(None, description="Patient sex")
     patient_age: Optional[str] = Field(
         None, pattern="^\\d{3}[DWMY]$", description="Patient age in DICOM format"
     )
@@ -28,10 +66,10 @@ class PatientSchema(BaseModel):
     @field_validator("patient_id")
     @classmethod
     def validate_patient_id(cls, v: str) -> str:
-        """Validate patient ID is not empty or whitespace."""
-        if not v or v.isspace():
+        """Validate patient ID is not empty once whitespace is stripped."""
+        if not v:
             raise ValueError("Patient ID cannot be empty or whitespace")
-        return v.strip()
+        return v
 
     @field_validator("patient_age")
     @classmethod
@@ -72,11 +110,7 @@ class StudySchema(BaseModel):
     @classmethod
     def validate_uid_format(cls, v: str) -> str:
         """Validate UID follows DICOM format (numeric components separated by dots)."""
-        if not re.match(r"^[\d\.]+$", v):
-            raise ValueError("Study UID must contain only digits and dots")
-        if v.startswith(".") or v.endswith(".") or ".." in v:
-            raise ValueError("Study UID has invalid dot placement")
-        return v
+        return _validate_uid(v, "Study UID")
 
     @field_validator("study_date")
     @classmethod
@@ -85,9 +119,8 @@ class StudySchema(BaseModel):
         if v is None:
             return v
 
-        try:
-            datetime.strptime(v, "%Y%m%d")
-        except ValueError:
+        # Field pattern guarantees 8 digits, so slice straight into integers
+        if not _is_valid_date(int(v[0:4]), int(v[4:6]), int(v[6:8])):
             raise ValueError(f"Invalid study date format: {v}")
 
         return v
@@ -99,23 +132,15 @@ class SeriesSchema(BaseModel):
     series_instance_uid: str = Field(..., min_length=1, description="Unique series identifier")
     series_number: Optional[int] = Field(None, ge=0, le=99999, description="Series number")
     series_description: Optional[str] = Field(None, max_length=64)
-    modality: str = Field(..., min_length=2, max_length=16, description="Imaging modality")
+    modality: Annotated[str, StringConstraints(to_upper=True, min_length=2, max_length=16)] = Field(
+        ..., description="Imaging modality"
+    )
 
     @field_validator("series_instance_uid")
     @classmethod
     def validate_uid_format(cls, v: str) -> str:
         """Validate UID follows DICOM format."""
-        if not re.match(r"^[\d\.]+$", v):
-            raise ValueError("Series UID must contain only digits and dots")
-        if v.startswith(".") or v.endswith(".") or ".." in v:
-            raise ValueError("Series UID has invalid dot placement")
-        return v
-
-    @field_validator("modality")
-    @classmethod
-    def validate_modality(cls, v: str) -> str:
-        """Validate modality is uppercase."""
-        return v.upper()
+        return _validate_uid(v, "Series UID")
 
 
 class ImageMetadataSchema(BaseModel):
@@ -125,13 +150,15 @@ class ImageMetadataSchema(BaseModel):
     columns: Optional[int] = Field(None, ge=1, le=65535, description="Image width in pixels")
     bits_allocated: Optional[int] = Field(None, ge=1, le=64, description="Bits allocated per pixel")
     bits_stored: Optional[int] = Field(None, ge=1, le=64, description="Bits stored per pixel")
-    pixel_spacing: Optional[List[float]] = Field(None, description="Pixel spacing [row, column]")
+    pixel_spacing: Optional[Tuple[float, float]] = Field(
+        None, description="Pixel spacing (row, column)"
+    )
 
-    @field_validator("pixel_spacing")
+    @field_validator("pixel_spacing", mode="before")
     @classmethod
-    def validate_pixel_spacing(cls, v: Optional[List[float]]) -> Optional[List[float]]:
-        """Validate pixel spacing has exactly 2 elements."""
-        if v is not None and len(v) != 2:
+    def validate_pixel_spacing(cls, v: Any) -> Any:
+        """Reject wrong-length sequences with a clear message; arity is enforced by the type."""
+        if isinstance(v, Sequence) and not isinstance(v, str) and len(v) != 2:
             raise ValueError("Pixel spacing must have exactly 2 elements [row, column]")
         return v
 
@@ -150,6 +177,7 @@ class ImageMetadataSchema(BaseModel):
 class CTMetadataSchema(BaseModel):
     """Schema for CT-specific metadata."""
 
+    modality_tag: Literal["CT"] = Field("CT", description="Discriminator for modality metadata")
     kvp: Optional[float] = Field(None, ge=0, le=200, description="kVp (kilovoltage peak)")
     slice_thickness: Optional[float] = Field(None, ge=0, description="Slice thickness in mm")
     reconstruction_diameter: Optional[float] = Field(None, ge=0, description="Reconstruction FOV")
@@ -158,6 +186,7 @@ class CTMetadataSchema(BaseModel):
 class MRMetadataSchema(BaseModel):
     """Schema for MR-specific metadata."""
 
+    modality_tag: Literal["MR"] = Field("MR", description="Discriminator for modality metadata")
     repetition_time: Optional[float] = Field(None, ge=0, description="TR in ms")
     echo_time: Optional[float] = Field(None, ge=0, description="TE in ms")
     magnetic_field_strength: Optional[float] = Field(
@@ -165,6 +194,12 @@ class MRMetadataSchema(BaseModel):
     )
 
 
+# Tagged union: pydantic-core picks the branch from modality_tag instead of trying each
+ModalityMetadata = Annotated[
+    Union[CTMetadataSchema, MRMetadataSchema], Field(discriminator="modality_tag")
+]
+
+
 class DICOMInstanceSchema(BaseModel):
     """Schema for complete DICOM instance metadata."""
 
@@ -176,33 +211,86 @@ class DICOMInstanceSchema(BaseModel):
     @classmethod
     def validate_uid_format(cls, v: str) -> str:
         """Validate UID follows DICOM format."""
-        if not re.match(r"^[\d\.]+$", v):
-            raise ValueError("UID must contain only digits and dots")
-        if v.startswith(".") or v.endswith(".") or ".." in v:
-            raise ValueError("UID has invalid dot placement")
-        return v
+        return _validate_uid(v, "UID")
 
 
 class DICOMMetadataSchema(BaseModel):
-    """Complete DICOM metadata schema combining all components."""
+    """
+    Complete DICOM metadata schema combining all components.
+
+    CT and MR metadata share the single modality_metadata field, which
+    replaces the former ct_metadata and mr_metadata fields. Serialized
+    records carry it under that key, tagged by modality_tag.
+    """
 
     patient: PatientSchema
     study: StudySchema
     series: SeriesSchema
     instance: DICOMInstanceSchema
     image: Optional[ImageMetadataSchema] = None
-    ct_metadata: Optional[CTMetadataSchema] = None
-    mr_metadata: Optional[MRMetadataSchema] = None
+    modality_metadata: Optional[ModalityMetadata] = None
+
+    @classmethod
+    def assemble(
+        cls,
+        patient: PatientSchema,
+        study: StudySchema,
+        series: SeriesSchema,
+        instance: DICOMInstanceSchema,
+        image: Optional[ImageMetadataSchema] = None,
+        modality_metadata: Optional[Union[CTMetadataSchema, MRMetadataSchema]] = None,
+    ) -> "DICOMMetadataSchema":
+        """
+        Combine already-validated sub-schemas without re-running field validation.
+
+        Only the modality cross-check is applied, so callers must pass schema
+        instances they built themselves rather than raw dictionaries.
+
+        Args:
+            patient: Validated patient schema
+            study: Validated study schema
+            series: Validated series schema
+            instance: Validated instance schema
+            image: Validated image metadata, if any
+            modality_metadata: Validated CT or MR metadata, if any
+
+        Returns:
+            Assembled DICOMMetadataSchema object
+
+        Raises:
+            ValidationError: If modality-specific metadata does not match the modality
+        """
+        fields: Dict[str, Any] = {
+            "patient": patient,
+            "study": study,
+            "series": series,
+            "instance": instance,
+        }
+        if image is not None:
+            fields["image"] = image
+        if modality_metadata is not None:
+            fields["modality_metadata"] = modality_metadata
+
+        metadata = cls.model_construct(_fields_set=set(fields), **fields)
+        try:
+            return metadata.validate_modality_specific_metadata()
+        except ValueError as e:
+            # Report the failure the same way the model validator does on __init__
+            raise ValidationError.from_exception_data(
+                cls.__name__,
+                [{"type": "value_error", "loc": (), "input": fields, "ctx": {"error": e}}],
+            ) from e
 
     @model_validator(mode="after")
     def validate_modality_specific_metadata(self) -> "DICOMMetadataSchema":
         """Ensure modality-specific metadata matches the modality."""
-        modality = self.series.modality
+        if self.modality_metadata is None:
+            return self
 
-        if modality == "CT" and self.mr_metadata is not None:
-            raise ValueError("CT modality should not have MR metadata")
-        if modality == "MR" and self.ct_metadata is not None:
-            raise ValueError("MR modality should not have CT metadata")
+        modality = self.series.modality
+        tag = self.modality_metadata.modality_tag
+        if modality in ("CT", "MR") and tag != modality:
+            raise ValueError(f"{modality} modality should not have {tag} metadata")
 
         return self
 
@@ -214,28 +302,50 @@ class CSVRecordSchema(BaseModel):
     study_date: str = Field(..., pattern="^\\d{4}-\\d{2}-\\d{2}$")
     modality: str = Field(..., min_length=2)
     accession_number: Optional[str] = None
-    status: Optional[str] = Field(None, pattern="^(pending|completed|failed)$")
+    status: Optional[Literal["pending", "completed", "failed"]] = None
 
     @field_validator("study_date")
     @classmethod
     def validate_date_format(cls, v: str) -> str:
         """Validate date is valid."""
-        try:
-            datetime.strptime(v, "%Y-%m-%d")
-        except ValueError:
+        # Field pattern guarantees YYYY-MM-DD digits, so slice straight into integers
+        if not _is_valid_date(int(v[0:4]), int(v[5:7]), int(v[8:10])):
             raise ValueError(f"Invalid date format: {v}")
         return v
 
 
 class DeliveryFileSchema(BaseModel):
-    """Schema for a file in delivery package."""
+    """
+    Schema for a file in delivery package.
+
+    The presigned URL only gets a scheme check here; S3 rejects a malformed
+    URL when it is actually used.
+    """
 
     file_path: str = Field(..., min_length=1)
     file_size: int = Field(..., ge=0, description="File size in bytes")
-    checksum: str = Field(..., min_length=32, max_length=64, description="File checksum")
-    presigned_url: Optional[str] = Field(None, description="S3 presigned URL")
+    checksum: str = Field(..., description="Hex-encoded file checksum")
+    presigned_url: Optional[Annotated[str, StringConstraints(pattern=r"^https?://")]] = Field(
+        None, description="S3 presigned URL"
+    )
     url_expiration: Optional[str] = Field(None, description="URL expiration timestamp")
 
+    @field_validator("checksum")
+    @classmethod
+    def validate_checksum(cls, v: str) -> str:
+        """Validate checksum is a hex digest of a supported length."""
+        if len(v) not in _VALID_CHECKSUM_LENGTHS:
+            raise ValueError(f"Checksum length must be one of 32, 40, 64 or 128, got {len(v)}")
+
+        # fromhex skips whitespace between bytes, so also confirm nothing was skipped
+        try:
+            valid = len(bytes.fromhex(v)) * 2 == len(v)
+        except ValueError:
+            valid = False
+        if not valid:
+            raise ValueError("Checksum must contain only hexadecimal characters")
+        return v
+
 
 class DeliveryManifestSchema(BaseModel):
     """Schema for delivery manifest containing multiple files."""
@@ -253,14 +363,19 @@ class DeliveryManifestSchema(BaseModel):
     @classmethod
     def validate_timestamp(cls, v: str) -> str:
         """Validate ISO 8601 timestamp."""
-        # Check for ISO 8601 format with regex first
-        iso_pattern = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:\d{2})$"
-        if not re.match(iso_pattern, v):
+        # Regex fixes the field positions, so range checks can slice directly
+        if not _ISO8601_RE.fullmatch(v):
             raise ValueError(f"Invalid ISO 8601 timestamp: {v}")
 
-        try:
-            datetime.fromisoformat(v.replace("Z", "+00:00"))
-        except ValueError:
+        valid = (
+            _is_valid_date(int(v[0:4]), int(v[5:7]), int(v[8:10]))
+            and int(v[11:13]) <= 23
+            and int(v[14:16]) <= 59
+            and int(v[17:19]) <= 59
+        )
+        if valid and not v.endswith("Z"):
+            valid = int(v[-5:-3]) <= 23 and int(v[-2:]) <= 59
+        if not valid:
             raise ValueError(f"Invalid ISO 8601 timestamp: {v}")
         return v
 
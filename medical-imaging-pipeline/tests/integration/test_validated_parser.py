@@ -129,9 +129,9 @@ class TestValidatedDICOMParser:
         assert result.patient.patient_sex == "M"
         assert result.study.study_instance_uid == "1.2.3.4.5.6.7.8.9"
         assert result.series.modality == "CT"
-        assert result.ct_metadata is not None
-        assert result.ct_metadata.kvp == 120
-        assert result.mr_metadata is None
+        assert result.modality_metadata.modality_tag == "CT"
+        assert result.modality_metadata.kvp == 120
+        assert not hasattr(result.modality_metadata, "repetition_time")
 
     @patch("pydicom.dcmread")
     def test_parse_and_validate_mr_success(
@@ -153,10 +153,10 @@ class TestValidatedDICOMParser:
         # Verify
         assert isinstance(result, DICOMMetadataSchema)
         assert result.series.modality == "MR"
-        assert result.mr_metadata is not None
-        assert result.mr_metadata.repetition_time == 500
-        assert result.mr_metadata.magnetic_field_strength == 1.5
-        assert result.ct_metadata is None
+        assert result.modality_metadata.modality_tag == "MR"
+        assert result.modality_metadata.repetition_time == 500
+        assert result.modality_metadata.magnetic_field_strength == 1.5
+        assert not hasattr(result.modality_metadata, "kvp")
 
     def test_validate_dataset_ct(
         self, validated_parser: ValidatedDICOMParser, sample_ct_dataset: Dataset
@@ -168,7 +168,8 @@ class TestValidatedDICOMParser:
         assert result.series.modality == "CT"
         assert result.image is not None
         assert result.image.rows == 512
-        assert result.ct_metadata is not None
+        assert result.modality_metadata.modality_tag == "CT"
+        assert not hasattr(result.modality_metadata, "repetition_time")
 
     def test_validate_dataset_mr(
         self, validated_parser: ValidatedDICOMParser, sample_mr_dataset: Dataset
@@ -178,7 +179,8 @@ class TestValidatedDICOMParser:
 
         assert result.patient.patient_id == "TEST456"
         assert result.series.modality == "MR"
-        assert result.mr_metadata is not None
+        assert result.modality_metadata.modality_tag == "MR"
+        assert not hasattr(result.modality_metadata, "kvp")
 
     def test_validate_dataset_invalid_uid_fails(
         self, validated_parser: ValidatedDICOMParser
@@ -296,7 +298,7 @@ class TestValidatedDICOMParser:
 
         result = validated_parser.validate_dataset(ds)
 
-        assert result.ct_metadata is None
+        assert result.modality_metadata is None
 
     def test_image_metadata_with_bits_validation(
         self, validated_parser: ValidatedDICOMParser
@@ -0,0 +1,42 @@
+"""
+Shared fixtures for unit tests.
+"""
+
+import pytest
+
+from src.validation.schemas import (
+    DICOMInstanceSchema,
+    PatientSchema,
+    SeriesSchema,
+    StudySchema,
+)
+
+
+@pytest.fixture(scope="session")
+def base_patient() -> PatientSchema:
+    """Validated patient schema shared across tests."""
+    return PatientSchema(patient_id="test")
+
+
+@pytest.fixture(scope="session")
+def base_study() -> StudySchema:
+    """Validated study schema shared across tests."""
+    return StudySchema(study_instance_uid="1.2.3")
+
+
+@pytest.fixture(scope="session")
+def base_series_ct() -> SeriesSchema:
+    """Validated CT series schema shared across tests."""
+    return SeriesSchema(series_instance_uid="1.2.3.4", modality="CT")
+
+
+@pytest.fixture(scope="session")
+def base_series_mr() -> SeriesSchema:
+    """Validated MR series schema shared across tests."""
+    return SeriesSchema(series_instance_uid="1.2.3.4", modality="MR")
+
+
+@pytest.fixture(scope="session")
+def base_instance() -> DICOMInstanceSchema:
+    """Validated instance schema shared across tests."""
+    return DICOMInstanceSchema(sop_instance_uid="1.2.3.4.5", sop_class_uid="1.2.840")
@@ -1,222 +1,338 @@
 """Tests for PresignedUrlHandler."""
 
+from hashlib import md5
+from unittest.mock import patch
+from urllib.parse import parse_qs, unquote, urlsplit
+
 import pytest
+from botocore import auth
 from botocore.exceptions import ClientError
 from moto import mock_aws
 
 from src.delivery.presigned_url_handler import PresignedUrlHandler
 
+# Every test here is fully mocked, so keep boto3's default session between mocks
+MOTO_CONFIG = {"core": {"reset_boto3_session": False}}
+
+# Objects every test starts with; the autouse reset restores exactly this set
+CANONICAL_OBJECTS = {
+    "test/file.dcm": b"test content",
+    "test/file2.dcm": b"test content 2",
+}
+CANONICAL_ETAGS = {key: f'"{md5(body).hexdigest()}"' for key, body in CANONICAL_OBJECTS.items()}
+
+_ACCESS_DENIED_RESPONSE = {"Error": {"Code": "AccessDenied", "Message": "Access denied"}}
+
+
+def _access_denied(operation_name):
+    """Build a fresh AccessDenied ClientError so no traceback is shared between raises."""
+    return ClientError(_ACCESS_DENIED_RESPONSE, operation_name)
+
+
+def _qs(url):
+    """Parse a URL's query string once into a dict of value lists."""
+    return parse_qs(urlsplit(url).query)
+
+
+def assert_presigned_url(url, *, bucket, key, expected=None):
+    """Assert a presigned URL targets bucket/key and carries the expected query values."""
+    parts = urlsplit(url)
+    path = unquote(parts.path)
+    assert bucket in parts.netloc or path.startswith(f"/{bucket}/")
+    assert path.endswith(f"/{key}")
+    q = parse_qs(parts.query)
+    for name, value in (expected or {}).items():
+        assert q.get(name) == [value], (name, q.get(name))
 
-@pytest.fixture
-def aws_credentials(monkeypatch):
-    """Mock AWS credentials for testing."""
-    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
-    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
-    monkeypatch.setenv("AWS_SECURITY_TOKEN", "testing")
-    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
-    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
 
+@pytest.fixture(scope="session")
+def aws_credentials():
+    """Mock AWS credentials for testing, set once for the whole session."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("AWS_ACCESS_KEY_ID", "testing")
+        mp.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+        mp.setenv("AWS_SECURITY_TOKEN", "testing")
+        mp.setenv("AWS_SESSION_TOKEN", "testing")
+        mp.setenv("AWS_DEFAULT_REGION", "us-east-1")
+        yield
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def bucket_name():
     """Test bucket name."""
     return "test-dicom-bucket"
 
 
-@pytest.fixture
-def presigned_url_handler(aws_credentials, bucket_name):
-    """Create PresignedUrlHandler with mocked AWS."""
-    with mock_aws():
-        handler = PresignedUrlHandler(bucket_name=bucket_name, region_name="us-east-1")
-
-        # Create the bucket and add test objects
-        handler.s3_client.create_bucket(Bucket=bucket_name)
-        handler.s3_client.put_object(Bucket=bucket_name, Key="test/file.dcm", Body=b"test content")
-        handler.s3_client.put_object(
-            Bucket=bucket_name, Key="test/file2.dcm", Body=b"test content 2"
+@pytest.fixture(scope="module")
+def _mock_aws_session(aws_credentials):
+    """
+    Keep one mocked AWS context open for the whole module.
+
+    Module (not session) scope closes the mock before another module's tests run
+    on the same xdist worker, so their own mock_aws() contexts still reset state.
+    """
+    with mock_aws(config=MOTO_CONFIG):
+        yield
+
+
+@pytest.fixture(scope="module")
+def presigned_url_handler(_mock_aws_session, bucket_name):
+    """Create PresignedUrlHandler and its bucket once per module."""
+    handler = PresignedUrlHandler(bucket_name=bucket_name, region_name="us-east-1")
+    handler.s3_client.create_bucket(Bucket=bucket_name)
+    # Populate up front so module-scoped results can be built before the per-test reset
+    for key, body in CANONICAL_OBJECTS.items():
+        handler.s3_client.put_object(Bucket=bucket_name, Key=key, Body=body)
+    return handler
+
+
+@pytest.fixture(scope="module")
+def secure_url_existing(presigned_url_handler):
+    """Validated secure download URL for an existing object, built once per module."""
+    return presigned_url_handler.generate_secure_download_url(
+        object_key="test/file.dcm", expiration_seconds=3600, validate_exists=True
+    )
+
+
+@pytest.fixture(scope="session")
+def bare_handler(aws_credentials, bucket_name):
+    """
+    Create a PresignedUrlHandler outside moto for tests that only presign.
+
+    Presigning is client-side and never calls S3, so these tests skip the mock.
+    """
+    return PresignedUrlHandler(bucket_name=bucket_name, region_name="us-east-1")
+
+
+@pytest.fixture(scope="module")
+def full_download_result(bare_handler):
+    """Download URL with every optional response header, built once per module."""
+    return bare_handler.generate_download_url(
+        object_key="test/file.dcm",
+        expiration_seconds=3600,
+        response_content_type="application/dicom",
+        response_content_disposition='attachment; filename="file.dcm"',
+    )
+
+
+@pytest.fixture(scope="module")
+def custom_creds_handler(_mock_aws_session, bucket_name):
+    """Create a PresignedUrlHandler with explicit credentials once per module."""
+    return PresignedUrlHandler(
+        bucket_name=bucket_name,
+        region_name="us-west-2",
+        aws_access_key_id="custom_key",
+        aws_secret_access_key="custom_secret",
+    )
+
+
+@pytest.fixture(scope="module")
+def many_keys():
+    """
+    Object keys for batch tests.
+
+    Presigning never reads S3, so the keys are not uploaded; this also keeps
+    them clear of the per-test bucket reset.
+    """
+    return [f"batch/file{i:03d}.dcm" for i in range(100)]
+
+
+@pytest.fixture(autouse=True)
+def _fast_signing(request, monkeypatch):
+    """
+    Skip query-string signing in tests that only check URL shape (test-only speedup).
+
+    moto never verifies presigned signatures, so the HMAC work is wasted here.
+    Tests marked ``real_signing`` keep botocore's signers intact.
+    """
+    if request.node.get_closest_marker("real_signing"):
+        return
+    for signer in (auth.HmacV1QueryAuth, auth.S3SigV4QueryAuth):
+        monkeypatch.setattr(signer, "add_auth", lambda self, request: None)
+
+
+@pytest.fixture(autouse=True)
+def _reset_bucket(request):
+    """Restore the bucket to the canonical objects before each test that uses it."""
+    if "presigned_url_handler" not in request.fixturenames:
+        return
+
+    handler = request.getfixturevalue("presigned_url_handler")
+    s3_client = handler.s3_client
+    listing = s3_client.list_objects_v2(Bucket=handler.bucket_name).get("Contents", [])
+    current = {obj["Key"]: obj["ETag"] for obj in listing}
+
+    stale = [key for key, etag in current.items() if CANONICAL_ETAGS.get(key) != etag]
+    if stale:
+        s3_client.delete_objects(
+            Bucket=handler.bucket_name,
+            Delete={"Objects": [{"Key": key} for key in stale]},
         )
 
-        yield handler
+    for key, body in CANONICAL_OBJECTS.items():
+        if current.get(key) != CANONICAL_ETAGS[key]:
+            s3_client.put_object(Bucket=handler.bucket_name, Key=key, Body=body)
 
 
 class TestPresignedUrlHandlerInitialization:
     """Tests for PresignedUrlHandler initialization."""
 
-    def test_init_with_default_credentials(self, aws_credentials, bucket_name):
+    def test_init_with_default_credentials(self, presigned_url_handler, bucket_name):
         """Test initialization with default credentials."""
-        with mock_aws():
-            handler = PresignedUrlHandler(bucket_name=bucket_name, region_name="us-east-1")
+        assert presigned_url_handler.bucket_name == bucket_name
+        assert presigned_url_handler.region_name == "us-east-1"
+        assert presigned_url_handler.s3_client is not None
 
-            assert handler.bucket_name == bucket_name
-            assert handler.region_name == "us-east-1"
-            assert handler.s3_client is not None
-
-    def test_init_with_custom_credentials(self, aws_credentials, bucket_name):
+    def test_init_with_custom_credentials(self, custom_creds_handler, bucket_name):
         """Test initialization with custom credentials."""
-        with mock_aws():
-            handler = PresignedUrlHandler(
-                bucket_name=bucket_name,
-                region_name="us-west-2",
-                aws_access_key_id="custom_key",
-                aws_secret_access_key="custom_secret",
-            )
+        assert custom_creds_handler.bucket_name == bucket_name
+        assert custom_creds_handler.region_name == "us-west-2"
+        assert custom_creds_handler.s3_client is not None
+
+    def test_init_with_injected_client(self, presigned_url_handler):
+        """Test an injected S3 client is used instead of creating one."""
+        other = PresignedUrlHandler(
+            bucket_name="other-bucket", s3_client=presigned_url_handler.s3_client
+        )
 
-            assert handler.bucket_name == bucket_name
-            assert handler.region_name == "us-west-2"
-            assert handler.s3_client is not None
+        assert other.s3_client is presigned_url_handler.s3_client
 
 
 class TestDownloadUrlGeneration:
     """Tests for download URL generation."""
 
-    def test_generate_download_url_success(self, presigned_url_handler):
-        """Test successful download URL generation."""
-        result = presigned_url_handler.generate_download_url(
-            object_key="test/file.dcm", expiration_seconds=3600
+    @pytest.mark.parametrize("exp", [3600, 1800], ids=["default", "custom_expiration"])
+    def test_generate_download_url(self, bare_handler, exp):
+        """Test download URL generation across expirations."""
+        result = bare_handler.generate_download_url(
+            object_key="test/file.dcm", expiration_seconds=exp
         )
 
-        assert "url" in result
-        assert "expires_in" in result
-        assert "object_key" in result
-        assert "bucket" in result
-        assert result["expires_in"] == 3600
+        assert result["expires_in"] == exp
         assert result["object_key"] == "test/file.dcm"
         assert result["bucket"] == "test-dicom-bucket"
-        assert "test/file.dcm" in result["url"]
-
-    def test_generate_download_url_with_custom_expiration(self, presigned_url_handler):
-        """Test download URL generation with custom expiration."""
-        result = presigned_url_handler.generate_download_url(
-            object_key="test/file.dcm", expiration_seconds=1800
-        )
+        assert_presigned_url(result["url"], bucket="test-dicom-bucket", key="test/file.dcm")
 
-        assert result["expires_in"] == 1800
-        assert "url" in result
-
-    def test_generate_download_url_with_response_headers(self, presigned_url_handler):
+    def test_generate_download_url_with_response_headers(self, full_download_result):
         """Test download URL generation with custom response headers."""
-        result = presigned_url_handler.generate_download_url(
-            object_key="test/file.dcm",
-            expiration_seconds=3600,
-            response_content_type="application/dicom",
-            response_content_disposition='attachment; filename="file.dcm"',
+        assert_presigned_url(
+            full_download_result["url"],
+            bucket="test-dicom-bucket",
+            key="test/file.dcm",
+            expected={
+                "response-content-type": "application/dicom",
+                "response-content-disposition": 'attachment; filename="file.dcm"',
+            },
         )
 
-        assert "url" in result
-        # Parameters are URL-encoded in the presigned URL
-        assert "response-content-type" in result["url"].lower()
-        assert "response-content-disposition" in result["url"].lower()
-
-    def test_generate_download_url_nonexistent_object(self, presigned_url_handler):
+    def test_generate_download_url_nonexistent_object(self, bare_handler):
         """Test download URL generation for nonexistent object still succeeds."""
         # Presigned URLs are generated without checking object existence by default
-        result = presigned_url_handler.generate_download_url(
+        result = bare_handler.generate_download_url(
             object_key="nonexistent/file.dcm", expiration_seconds=3600
         )
 
-        assert "url" in result
         assert result["object_key"] == "nonexistent/file.dcm"
+        assert_presigned_url(result["url"], bucket="test-dicom-bucket", key="nonexistent/file.dcm")
+
+    @pytest.mark.real_signing
+    def test_generate_download_url_is_signed(self, bare_handler):
+        """Test download URLs carry credentials and an expiry when really signed."""
+        result = bare_handler.generate_download_url(
+            object_key="test/file.dcm", expiration_seconds=3600
+        )
+
+        q = _qs(result["url"])
+        assert "Signature" in q or "X-Amz-Signature" in q
+        assert "Expires" in q or "X-Amz-Expires" in q
 
 
 class TestUploadUrlGeneration:
     """Tests for upload URL generation."""
 
-    def test_generate_upload_url_success(self, presigned_url_handler):
-        """Test successful upload URL generation."""
-        result = presigned_url_handler.generate_upload_url(
-            object_key="test/new_file.dcm", expiration_seconds=3600
+    @pytest.mark.parametrize(
+        "exp,kwargs,query",
+        [
+            pytest.param(3600, {}, {}, id="default"),
+            # Signed headers only reach the query string when the signer runs
+            pytest.param(
+                3600,
+                {"content_type": "application/dicom"},
+                {"content-type": "application/dicom"},
+                id="content_type",
+                marks=pytest.mark.real_signing,
+            ),
+            pytest.param(
+                3600,
+                {"metadata": {"patient-id": "anonymous", "study-date": "2024-01-01"}},
+                {"x-amz-meta-patient-id": "anonymous", "x-amz-meta-study-date": "2024-01-01"},
+                id="metadata",
+                marks=pytest.mark.real_signing,
+            ),
+        ],
+    )
+    def test_generate_upload_url(self, bare_handler, exp, kwargs, query):
+        """Test upload URL generation with optional content type and metadata."""
+        result = bare_handler.generate_upload_url(
+            object_key="test/new_file.dcm", expiration_seconds=exp, **kwargs
         )
 
-        assert "url" in result
-        assert "expires_in" in result
-        assert "object_key" in result
-        assert "bucket" in result
-        assert result["expires_in"] == 3600
+        assert result["expires_in"] == exp
         assert result["object_key"] == "test/new_file.dcm"
         assert result["bucket"] == "test-dicom-bucket"
-
-    def test_generate_upload_url_with_content_type(self, presigned_url_handler):
-        """Test upload URL generation with content type."""
-        result = presigned_url_handler.generate_upload_url(
-            object_key="test/new_file.dcm",
-            expiration_seconds=3600,
-            content_type="application/dicom",
+        assert_presigned_url(
+            result["url"], bucket="test-dicom-bucket", key="test/new_file.dcm", expected=query
         )
 
-        assert "url" in result
-        # URL should contain content type parameter
-        assert "ContentType" in result["url"] or "content-type" in result["url"].lower()
-
-    def test_generate_upload_url_with_metadata(self, presigned_url_handler):
-        """Test upload URL generation with metadata."""
-        metadata = {"patient-id": "anonymous", "study-date": "2024-01-01"}
-
-        result = presigned_url_handler.generate_upload_url(
-            object_key="test/new_file.dcm",
-            expiration_seconds=3600,
-            metadata=metadata,
-        )
-
-        assert "url" in result
-        assert result["object_key"] == "test/new_file.dcm"
-
 
 class TestBatchUrlGeneration:
     """Tests for batch URL generation."""
 
-    def test_generate_batch_download_urls_success(self, presigned_url_handler):
-        """Test successful batch URL generation."""
-        object_keys = ["test/file.dcm", "test/file2.dcm"]
+    @pytest.mark.parametrize("max_workers", [1, 8])
+    @pytest.mark.parametrize("n", [1, 10, 100])
+    def test_generate_batch_download_urls_success(self, bare_handler, many_keys, n, max_workers):
+        """Test batch URL generation scales without per-key S3 calls."""
+        object_keys = many_keys[:n]
 
-        results = presigned_url_handler.generate_batch_download_urls(
-            object_keys=object_keys, expiration_seconds=3600
-        )
-
-        assert len(results) == 2
-        assert "test/file.dcm" in results
-        assert "test/file2.dcm" in results
+        with patch.object(bare_handler.s3_client, "head_object") as head_object:
+            results = bare_handler.generate_batch_download_urls(
+                object_keys=object_keys, expiration_seconds=3600, max_workers=max_workers
+            )
 
-        for key in object_keys:
-            assert "url" in results[key]
-            assert results[key]["object_key"] == key
-            assert results[key]["expires_in"] == 3600
+        assert len(results) == n
+        # Keys are signed concurrently but results keep the input order
+        assert list(results) == object_keys
+        assert all(
+            r["object_key"] == k and "url" in r and r["expires_in"] == 3600
+            for k, r in results.items()
+        )
+        head_object.assert_not_called()
 
-    def test_generate_batch_download_urls_empty_list(self, presigned_url_handler):
+    def test_generate_batch_download_urls_empty_list(self, bare_handler):
         """Test batch URL generation with empty list."""
-        results = presigned_url_handler.generate_batch_download_urls(
-            object_keys=[], expiration_seconds=3600
-        )
+        results = bare_handler.generate_batch_download_urls(object_keys=[], expiration_seconds=3600)
 
         assert len(results) == 0
 
-    def test_generate_batch_download_urls_with_failures(self, presigned_url_handler, monkeypatch):
+    def test_generate_batch_download_urls_with_failures(self, bare_handler, monkeypatch):
         """Test batch URL generation with some failures."""
         object_keys = ["test/file.dcm", "test/file2.dcm", "test/file3.dcm"]
 
-        # Mock generate_download_url to fail for one key
-        original_generate = presigned_url_handler.generate_download_url
-        call_count = [0]
-
-        def mock_generate(object_key, expiration_seconds):
-            call_count[0] += 1
-            if object_key == "test/file2.dcm":
-                raise ClientError(
-                    {"Error": {"Code": "AccessDenied", "Message": "Access denied"}},
-                    "generate_presigned_url",
-                )
-            return original_generate(object_key, expiration_seconds)
+        # Stub signing at the client so no key drives botocore's signer
+        def fake_presign(ClientMethod, Params, ExpiresIn):
+            if Params["Key"] == "test/file2.dcm":
+                raise _access_denied("generate_presigned_url")
+            return f"https://example.com/{Params['Key']}"
 
-        monkeypatch.setattr(presigned_url_handler, "generate_download_url", mock_generate)
+        monkeypatch.setattr(bare_handler.s3_client, "generate_presigned_url", fake_presign)
 
-        results = presigned_url_handler.generate_batch_download_urls(
+        results = bare_handler.generate_batch_download_urls(
             object_keys=object_keys, expiration_seconds=3600
         )
 
         # Should have results for 2 out of 3 keys
         assert len(results) == 2
-        assert "test/file.dcm" in results
-        assert "test/file3.dcm" in results
-        assert "test/file2.dcm" not in results
+        assert results.keys() == {"test/file.dcm", "test/file3.dcm"}
 
 
 class TestObjectValidation:
@@ -232,35 +348,43 @@ class TestObjectValidation:
         exists = presigned_url_handler.validate_object_exists("nonexistent/file.dcm")
         assert exists is False
 
-    def test_validate_object_exists_handles_errors(self, presigned_url_handler, monkeypatch):
+    def test_validate_object_exists_handles_errors(self, presigned_url_handler):
         """Test validation handles non-404 errors."""
-
-        def mock_head_object(*args, **kwargs):
-            raise ClientError(
-                {"Error": {"Code": "AccessDenied", "Message": "Access denied"}},
-                "head_object",
-            )
-
-        monkeypatch.setattr(presigned_url_handler.s3_client, "head_object", mock_head_object)
-
-        with pytest.raises(ClientError):
-            presigned_url_handler.validate_object_exists("test/file.dcm")
+        with patch.object(
+            presigned_url_handler.s3_client,
+            "head_object",
+            side_effect=_access_denied("head_object"),
+        ):
+            with pytest.raises(ClientError):
+                presigned_url_handler.validate_object_exists("test/file.dcm")
 
 
 class TestSecureDownloadUrl:
     """Tests for secure download URL generation."""
 
-    def test_generate_secure_download_url_success(self, presigned_url_handler):
+    def test_generate_secure_download_url_success(self, secure_url_existing):
         """Test secure download URL generation for existing object."""
-        result = presigned_url_handler.generate_secure_download_url(
-            object_key="test/file.dcm", expiration_seconds=3600, validate_exists=True
+        assert secure_url_existing is not None
+        assert secure_url_existing["object_key"] == "test/file.dcm"
+        assert secure_url_existing["expires_in"] == 3600
+
+    def test_generate_secure_download_url_with_dicom_headers(self, secure_url_existing):
+        """Test secure download URL sets the DICOM content type."""
+        assert_presigned_url(
+            secure_url_existing["url"],
+            bucket="test-dicom-bucket",
+            key="test/file.dcm",
+            expected={"response-content-type": "application/dicom"},
         )
 
-        assert result is not None
-        assert "url" in result
-        # Check for URL-encoded DICOM content type
-        assert "application%2Fdicom" in result["url"] or "dicom" in result["url"].lower()
-        assert "attachment" in result["url"]
+    def test_generate_secure_download_url_attachment_disposition(self, secure_url_existing):
+        """Test secure download URL downloads as an attachment named after the key."""
+        assert_presigned_url(
+            secure_url_existing["url"],
+            bucket="test-dicom-bucket",
+            key="test/file.dcm",
+            expected={"response-content-disposition": 'attachment; filename="file.dcm"'},
+        )
 
     def test_generate_secure_download_url_nonexistent(self, presigned_url_handler):
         """Test secure download URL for nonexistent object returns None."""
@@ -272,60 +396,44 @@ class TestSecureDownloadUrl:
 
         assert result is None
 
-    def test_generate_secure_download_url_skip_validation(self, presigned_url_handler):
+    def test_generate_secure_download_url_skip_validation(self, bare_handler):
         """Test secure download URL without validation."""
-        result = presigned_url_handler.generate_secure_download_url(
+        result = bare_handler.generate_secure_download_url(
             object_key="nonexistent/file.dcm",
             expiration_seconds=3600,
             validate_exists=False,
         )
 
         assert result is not None
-        assert "url" in result
-
-    def test_generate_secure_download_url_with_dicom_headers(self, presigned_url_handler):
-        """Test secure download URL includes DICOM-specific headers."""
-        result = presigned_url_handler.generate_secure_download_url(
-            object_key="test/file.dcm", expiration_seconds=1800, validate_exists=False
+        assert_presigned_url(
+            result["url"],
+            bucket="test-dicom-bucket",
+            key="nonexistent/file.dcm",
+            expected={"response-content-disposition": 'attachment; filename="file.dcm"'},
         )
 
-        assert result is not None
-        url = result["url"]
-
-        # Check for DICOM content type
-        assert "application%2Fdicom" in url or "application/dicom" in url
-
-        # Check for attachment disposition
-        assert "attachment" in url
-
 
 class TestIntegration:
     """Integration tests for PresignedUrlHandler."""
 
-    def test_full_download_workflow(self, presigned_url_handler):
-        """Test complete download workflow."""
-        # Validate object exists
-        exists = presigned_url_handler.validate_object_exists("test/file.dcm")
-        assert exists is True
+    def test_end_to_end(self, presigned_url_handler):
+        """Test validation, single, secure and batch URLs against one handler."""
+        assert presigned_url_handler.validate_object_exists("test/file.dcm") is True
 
-        # Generate download URL
-        result = presigned_url_handler.generate_download_url(
+        download = presigned_url_handler.generate_download_url(
             object_key="test/file.dcm", expiration_seconds=3600
         )
+        assert download["object_key"] == "test/file.dcm"
 
-        assert "url" in result
-        assert result["object_key"] == "test/file.dcm"
-
-    def test_full_secure_workflow(self, presigned_url_handler):
-        """Test complete secure download workflow."""
-        # Generate secure URL (includes validation)
-        result = presigned_url_handler.generate_secure_download_url(
+        secure = presigned_url_handler.generate_secure_download_url(
             object_key="test/file.dcm", expiration_seconds=3600, validate_exists=True
         )
+        assert secure is not None and secure["object_key"] == "test/file.dcm"
 
-        assert result is not None
-        assert "url" in result
-        assert result["object_key"] == "test/file.dcm"
+        batch = presigned_url_handler.generate_batch_download_urls(
+            object_keys=["test/file.dcm", "test/file2.dcm"], expiration_seconds=3600
+        )
+        assert batch.keys() == {"test/file.dcm", "test/file2.dcm"}
 
     def test_batch_workflow_with_mixed_results(self, presigned_url_handler):
         """Test batch workflow with existing and nonexistent objects."""
@@ -338,5 +446,5 @@ class TestIntegration:
 
         # All URLs should be generated (presigned URLs don't check existence)
         assert len(results) == 3
-        for key in object_keys:
-            assert key in results
+        assert results.keys() == set(object_keys)
+        assert all(r["object_key"] == k and "url" in r for k, r in results.items())
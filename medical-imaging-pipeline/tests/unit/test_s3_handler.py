@@ -5,15 +5,57 @@ Tests S3 operations using moto mocking library.
 """
 
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path
+from typing import Any, Dict, List
 
 import boto3
 import pytest
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from moto import mock_aws
 
 from src.storage.s3_handler import S3Handler
 
+SAMPLE_CONTENT = b"Sample DICOM content for testing"
+SAMPLE_MD5 = hashlib.md5(SAMPLE_CONTENT).hexdigest()
+UPLOADED_METADATA = {"patient-id": "P001", "study-uid": "1.2.3.4.5"}
+_NOT_FOUND_CODES = frozenset({"404", "NoSuchKey"})
+
+# Mocked requests never need retries; fail on the first error instead of backing off
+TEST_CLIENT_CONFIG = Config(retries={"total_max_attempts": 1})
+
+
+@dataclass(frozen=True)
+class SampleFile:
+    """On-disk sample file with its content captured up front."""
+
+    path: Path
+    size: int
+    data: bytes
+
+
+def _bulk_upload(handler: S3Handler, keys: List[str]) -> List[Dict[str, Any]]:
+    """Upload sample content to several keys concurrently."""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return list(
+            executor.map(
+                lambda key: handler.upload_fileobj(BytesIO(SAMPLE_CONTENT), s3_key=key), keys
+            )
+        )
+
+
+def _exists_via_list(handler: S3Handler, key: str) -> bool:
+    """Check object presence with a single prefix listing."""
+    return any(obj["key"] == key for obj in handler.list_objects(prefix=key, max_keys=1))
+
+
+def _canned_presigned_url(ClientMethod, Params, ExpiresIn, HttpMethod=None) -> str:
+    """Stand-in for boto3 presigning that skips SigV4 signing."""
+    return f"https://{Params['Bucket']}/{Params['Key']}?X-Amz-Expires={ExpiresIn}"
+
 
 @pytest.fixture
 def aws_credentials(monkeypatch):
@@ -25,7 +67,7 @@ def aws_credentials(monkeypatch):
     monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def s3_bucket_name():
     """Test bucket name."""
     return "test-dicom-bucket"
@@ -40,89 +82,110 @@ def s3_handler(aws_credentials, s3_bucket_name):
         s3_client.create_bucket(Bucket=s3_bucket_name)
 
         # Create handler
-        handler = S3Handler(bucket_name=s3_bucket_name, region_name="us-east-1")
+        handler = S3Handler(
+            bucket_name=s3_bucket_name, region_name="us-east-1", config=TEST_CLIENT_CONFIG
+        )
 
         yield handler
 
 
-@pytest.fixture
-def sample_file(tmp_path: Path) -> Path:
-    """Create sample test file."""
-    test_file = tmp_path / "test_file.txt"
-    test_file.write_text("Sample DICOM content for testing")
-    return test_file
-
-
-@pytest.fixture
-def sample_dicom_file(tmp_path: Path) -> Path:
-    """Create sample DICOM-like file."""
-    test_file = tmp_path / "test.dcm"
-    test_file.write_bytes(b"DICM" + b"\x00" * 100)
-    return test_file
-
-
+@pytest.fixture(scope="class")
+def class_mocked_aws():
+    """Mocked AWS context shared by every test in a class."""
+    with mock_aws():
+        yield
+
+
+@pytest.fixture(scope="session")
+def sample_file(tmp_path_factory: pytest.TempPathFactory) -> SampleFile:
+    """Create sample test file once per session."""
+    test_file = tmp_path_factory.mktemp("s3_samples") / "test_file.txt"
+    test_file.write_bytes(SAMPLE_CONTENT)
+    return SampleFile(path=test_file, size=len(SAMPLE_CONTENT), data=SAMPLE_CONTENT)
+
+
+@pytest.fixture(scope="session")
+def sample_dicom_file(tmp_path_factory: pytest.TempPathFactory) -> SampleFile:
+    """Create sample DICOM-like file once per session."""
+    test_file = tmp_path_factory.mktemp("s3_samples") / "test.dcm"
+    # DICM marker followed by zero padding; truncate extends the file sparsely
+    with open(test_file, "wb") as f:
+        f.truncate(104)
+        f.write(b"DICM")
+    return SampleFile(path=test_file, size=104, data=b"DICM" + bytes(100))
+
+
+@pytest.fixture(scope="class")
+def uploaded_object(class_mocked_aws, s3_bucket_name, sample_file: SampleFile):
+    """Upload one object with metadata and share it across a test class."""
+    boto3.client("s3", region_name="us-east-1").create_bucket(Bucket=s3_bucket_name)
+    handler = S3Handler(
+        bucket_name=s3_bucket_name, region_name="us-east-1", config=TEST_CLIENT_CONFIG
+    )
+    result = handler.upload_file(
+        local_path=sample_file.path,
+        s3_key="test/uploaded.txt",
+        metadata=UPLOADED_METADATA,
+        content_type="text/plain",
+    )
+    return handler, result
+
+
+@pytest.mark.usefixtures("class_mocked_aws")
 class TestS3HandlerInitialization:
     """Tests for S3Handler initialization."""
 
     def test_initialization_with_defaults(self, aws_credentials, s3_bucket_name):
         """Test handler initialization with default parameters."""
-        with mock_aws():
-            handler = S3Handler(bucket_name=s3_bucket_name)
-            assert handler.bucket_name == s3_bucket_name
-            assert handler.region_name == "us-east-1"
-            assert handler.s3_client is not None
-            assert handler.s3_resource is not None
+        handler = S3Handler(bucket_name=s3_bucket_name)
+        assert handler.bucket_name == s3_bucket_name
+        assert handler.region_name == "us-east-1"
+        assert handler.s3_client is not None
+        assert handler.s3_resource is not None
 
     def test_initialization_with_custom_region(self, aws_credentials, s3_bucket_name):
         """Test handler initialization with custom region."""
-        with mock_aws():
-            handler = S3Handler(bucket_name=s3_bucket_name, region_name="us-west-2")
-            assert handler.region_name == "us-west-2"
+        handler = S3Handler(bucket_name=s3_bucket_name, region_name="us-west-2")
+        assert handler.region_name == "us-west-2"
 
     def test_initialization_with_credentials(self, s3_bucket_name):
         """Test handler initialization with explicit credentials."""
-        with mock_aws():
-            handler = S3Handler(
-                bucket_name=s3_bucket_name,
-                aws_access_key_id="test_key",
-                aws_secret_access_key="test_secret",
-            )
-            assert handler.bucket_name == s3_bucket_name
+        handler = S3Handler(
+            bucket_name=s3_bucket_name,
+            aws_access_key_id="test_key",
+            aws_secret_access_key="test_secret",
+        )
+        assert handler.bucket_name == s3_bucket_name
+
+    def test_initialization_with_client_config(self, s3_bucket_name):
+        """Test handler passes a custom botocore config to its client."""
+        handler = S3Handler(bucket_name=s3_bucket_name, config=TEST_CLIENT_CONFIG)
+        assert handler.s3_client.meta.config.retries["total_max_attempts"] == 1
 
 
 class TestS3HandlerUpload:
     """Tests for file upload operations."""
 
-    def test_upload_file_success(self, s3_handler: S3Handler, sample_file: Path):
+    def test_upload_file_success(self, s3_handler: S3Handler, sample_file: SampleFile):
         """Test successful file upload."""
-        result = s3_handler.upload_file(local_path=sample_file, s3_key="test/sample.txt")
-
-        assert result["bucket"] == s3_handler.bucket_name
-        assert result["key"] == "test/sample.txt"
-        assert result["size"] == sample_file.stat().st_size
-        assert "etag" in result
-        assert "checksum" in result
-        assert result["content_type"] == "application/dicom"
-
-    def test_upload_file_with_metadata(self, s3_handler: S3Handler, sample_file: Path):
-        """Test file upload with custom metadata."""
-        metadata = {"patient-id": "P001", "study-uid": "1.2.3.4.5"}
-
-        result = s3_handler.upload_file(
-            local_path=sample_file, s3_key="test/with_metadata.txt", metadata=metadata
-        )
-
-        assert result["key"] == "test/with_metadata.txt"
-
-        # Verify metadata was stored
-        obj_metadata = s3_handler.get_object_metadata("test/with_metadata.txt")
-        assert "custom_metadata" in obj_metadata
-        assert obj_metadata["custom_metadata"]["patient-id"] == "P001"
-
-    def test_upload_file_with_custom_content_type(self, s3_handler: S3Handler, sample_file: Path):
+        result = s3_handler.upload_file(local_path=sample_file.path, s3_key="test/sample.txt")
+
+        expected = {
+            "bucket": s3_handler.bucket_name,
+            "key": "test/sample.txt",
+            "size": sample_file.size,
+            "content_type": "application/dicom",
+        }
+        dynamic = {field: result.pop(field) for field in ("etag", "checksum")}
+        assert result == expected
+        assert dynamic["etag"] and dynamic["checksum"]
+
+    def test_upload_file_with_custom_content_type(
+        self, s3_handler: S3Handler, sample_file: SampleFile
+    ):
         """Test file upload with custom content type."""
         result = s3_handler.upload_file(
-            local_path=sample_file,
+            local_path=sample_file.path,
             s3_key="test/custom_type.txt",
             content_type="text/plain",
         )
@@ -136,20 +199,48 @@ class TestS3HandlerUpload:
 
         assert "not found" in str(exc_info.value).lower()
 
-    def test_upload_file_with_string_path(self, s3_handler: S3Handler, sample_file: Path):
+    def test_upload_file_with_string_path(self, s3_handler: S3Handler, sample_file: SampleFile):
         """Test upload with string path instead of Path object."""
-        result = s3_handler.upload_file(local_path=str(sample_file), s3_key="test/string_path.txt")
+        result = s3_handler.upload_file(
+            local_path=str(sample_file.path), s3_key="test/string_path.txt"
+        )
 
         assert result["key"] == "test/string_path.txt"
 
+    def test_upload_fileobj_success(self, s3_handler: S3Handler):
+        """Test successful upload from in-memory buffer."""
+        result = s3_handler.upload_fileobj(BytesIO(SAMPLE_CONTENT), s3_key="test/buffer.txt")
+
+        assert result.pop("etag")
+        assert result == {
+            "bucket": s3_handler.bucket_name,
+            "key": "test/buffer.txt",
+            "size": len(SAMPLE_CONTENT),
+            "checksum": SAMPLE_MD5,
+            "content_type": "application/dicom",
+        }
+
+    def test_upload_fileobj_from_current_position(self, s3_handler: S3Handler):
+        """Test upload starts from the buffer's current position."""
+        buffer = BytesIO(b"header" + SAMPLE_CONTENT)
+        buffer.seek(len(b"header"))
+
+        result = s3_handler.upload_fileobj(
+            buffer, s3_key="test/offset.txt", content_type="text/plain"
+        )
+
+        assert result["size"] == len(SAMPLE_CONTENT)
+        assert result["content_type"] == "text/plain"
+        assert s3_handler.get_object_metadata("test/offset.txt")["size"] == len(SAMPLE_CONTENT)
+
 
 class TestS3HandlerDownload:
     """Tests for file download operations."""
 
-    def test_download_file_success(self, s3_handler: S3Handler, sample_file: Path, tmp_path: Path):
+    def test_download_file_success(self, s3_handler: S3Handler, tmp_path: Path):
         """Test successful file download."""
         # Upload first
-        s3_handler.upload_file(local_path=sample_file, s3_key="test/download.txt")
+        s3_handler.upload_fileobj(BytesIO(SAMPLE_CONTENT), s3_key="test/download.txt")
 
         # Download
         download_path = tmp_path / "downloaded.txt"
@@ -158,14 +249,17 @@ class TestS3HandlerDownload:
         assert result["key"] == "test/download.txt"
         assert result["local_path"] == str(download_path)
         assert download_path.exists()
-        assert download_path.read_text() == sample_file.read_text()
+        assert download_path.read_bytes() == SAMPLE_CONTENT
 
     def test_download_file_with_checksum_verification(
-        self, s3_handler: S3Handler, sample_file: Path, tmp_path: Path
+        self, s3_handler: S3Handler, tmp_path: Path, monkeypatch
     ):
-        """Test download with checksum verification."""
+        """Test download reports the checksum verification result."""
         # Upload
-        upload_result = s3_handler.upload_file(local_path=sample_file, s3_key="test/verify.txt")
+        upload_result = s3_handler.upload_fileobj(BytesIO(SAMPLE_CONTENT), s3_key="test/verify.txt")
+
+        # Stub hashing so only the flag propagation is exercised
+        monkeypatch.setattr(s3_handler, "_calculate_file_hash", lambda path: upload_result["etag"])
 
         # Download with verification
         download_path = tmp_path / "verified.txt"
@@ -173,17 +267,39 @@ class TestS3HandlerDownload:
             s3_key="test/verify.txt", local_path=download_path, verify_checksum=True
         )
 
-        assert "checksum" in result
-        assert "checksum_verified" in result
+        assert result["checksum"] == upload_result["etag"]
         assert result["checksum_verified"] is True
-        assert result["checksum"] == upload_result["checksum"]
 
-    def test_download_file_creates_parent_directories(
-        self, s3_handler: S3Handler, sample_file: Path, tmp_path: Path
+    def test_download_file_with_checksum_mismatch(
+        self, s3_handler: S3Handler, tmp_path: Path, monkeypatch
     ):
+        """Test download flags a checksum that does not match the ETag."""
+        s3_handler.upload_fileobj(BytesIO(SAMPLE_CONTENT), s3_key="test/mismatch.txt")
+        monkeypatch.setattr(s3_handler, "_calculate_file_hash", lambda path: "deadbeef")
+
+        result = s3_handler.download_file(
+            s3_key="test/mismatch.txt", local_path=tmp_path / "mismatch.txt", verify_checksum=True
+        )
+
+        assert result["checksum"] == "deadbeef"
+        assert result["checksum_verified"] is False
+
+    def test_checksum_actually_matches(self, s3_handler: S3Handler, tmp_path: Path):
+        """Test real MD5 verification of downloaded content."""
+        upload_result = s3_handler.upload_fileobj(BytesIO(SAMPLE_CONTENT), s3_key="test/md5.txt")
+
+        result = s3_handler.download_file(
+            s3_key="test/md5.txt", local_path=tmp_path / "md5.txt", verify_checksum=True
+        )
+
+        assert result["checksum"] == SAMPLE_MD5
+        assert result["checksum"] == upload_result["checksum"]
+        assert result["checksum_verified"] is True
+
+    def test_download_file_creates_parent_directories(self, s3_handler: S3Handler, tmp_path: Path):
         """Test download creates parent directories if they don't exist."""
         # Upload
-        s3_handler.upload_file(local_path=sample_file, s3_key="test/nested.txt")
+        s3_handler.upload_fileobj(BytesIO(SAMPLE_CONTENT), s3_key="test/nested.txt")
 
         # Download to nested path
         download_path = tmp_path / "nested" / "dir" / "file.txt"
@@ -199,7 +315,7 @@ class TestS3HandlerDownload:
         with pytest.raises(ClientError) as exc_info:
             s3_handler.download_file(s3_key="nonexistent/key.txt", local_path=download_path)
 
-        assert exc_info.value.response["Error"]["Code"] in ["404", "NoSuchKey"]
+        assert exc_info.value.response["Error"]["Code"] in _NOT_FOUND_CODES
 
 
 class TestS3HandlerList:
@@ -212,12 +328,10 @@ class TestS3HandlerList:
         assert isinstance(objects, list)
         assert len(objects) == 0
 
-    def test_list_objects_with_files(self, s3_handler: S3Handler, sample_file: Path):
+    def test_list_objects_with_files(self, s3_handler: S3Handler):
         """Test listing objects with files present."""
         # Upload multiple files
-        s3_handler.upload_file(local_path=sample_file, s3_key="file1.txt")
-        s3_handler.upload_file(local_path=sample_file, s3_key="file2.txt")
-        s3_handler.upload_file(local_path=sample_file, s3_key="dir/file3.txt")
+        _bulk_upload(s3_handler, ["file1.txt", "file2.txt", "dir/file3.txt"])
 
         objects = s3_handler.list_objects()
 
@@ -227,12 +341,13 @@ class TestS3HandlerList:
         assert "file2.txt" in keys
         assert "dir/file3.txt" in keys
 
-    def test_list_objects_with_prefix(self, s3_handler: S3Handler, sample_file: Path):
+    def test_list_objects_with_prefix(self, s3_handler: S3Handler):
         """Test listing objects with prefix filter."""
         # Upload files with different prefixes
-        s3_handler.upload_file(local_path=sample_file, s3_key="patient-001/study1.dcm")
-        s3_handler.upload_file(local_path=sample_file, s3_key="patient-001/study2.dcm")
-        s3_handler.upload_file(local_path=sample_file, s3_key="patient-002/study1.dcm")
+        _bulk_upload(
+            s3_handler,
+            ["patient-001/study1.dcm", "patient-001/study2.dcm", "patient-002/study1.dcm"],
+        )
 
         # List with prefix
         objects = s3_handler.list_objects(prefix="patient-001/")
@@ -241,20 +356,19 @@ class TestS3HandlerList:
         keys = [obj["key"] for obj in objects]
         assert all(key.startswith("patient-001/") for key in keys)
 
-    def test_list_objects_max_keys(self, s3_handler: S3Handler, sample_file: Path):
+    def test_list_objects_max_keys(self, s3_handler: S3Handler):
         """Test listing objects with max_keys limit."""
         # Upload 5 files
-        for i in range(5):
-            s3_handler.upload_file(local_path=sample_file, s3_key=f"file{i}.txt")
+        _bulk_upload(s3_handler, [f"file{i}.txt" for i in range(5)])
 
         # List with max_keys=3
         objects = s3_handler.list_objects(max_keys=3)
 
         assert len(objects) == 3
 
-    def test_list_objects_metadata_structure(self, s3_handler: S3Handler, sample_file: Path):
+    def test_list_objects_metadata_structure(self, s3_handler: S3Handler):
         """Test that list_objects returns correct metadata structure."""
-        s3_handler.upload_file(local_path=sample_file, s3_key="test.txt")
+        s3_handler.upload_fileobj(BytesIO(SAMPLE_CONTENT), s3_key="test.txt")
 
         objects = s3_handler.list_objects()
 
@@ -270,19 +384,19 @@ class TestS3HandlerList:
 class TestS3HandlerDelete:
     """Tests for delete operations."""
 
-    def test_delete_object_success(self, s3_handler: S3Handler, sample_file: Path):
+    def test_delete_object_success(self, s3_handler: S3Handler):
         """Test successful object deletion."""
         # Upload first
-        s3_handler.upload_file(local_path=sample_file, s3_key="to_delete.txt")
+        s3_handler.upload_fileobj(BytesIO(SAMPLE_CONTENT), s3_key="to_delete.txt")
 
         # Verify exists
-        assert s3_handler.object_exists("to_delete.txt") is True
+        assert _exists_via_list(s3_handler, "to_delete.txt") is True
 
         # Delete
         result = s3_handler.delete_object("to_delete.txt")
 
         assert result is True
-        assert s3_handler.object_exists("to_delete.txt") is False
+        assert _exists_via_list(s3_handler, "to_delete.txt") is False
 
     def test_delete_nonexistent_object(self, s3_handler: S3Handler):
         """Test deleting non-existent object (should succeed without error)."""
@@ -295,10 +409,10 @@ class TestS3HandlerDelete:
 class TestS3HandlerPresignedURL:
     """Tests for presigned URL generation."""
 
-    def test_generate_presigned_url_get(self, s3_handler: S3Handler, sample_file: Path):
+    def test_generate_presigned_url_get(self, s3_handler: S3Handler):
         """Test generating presigned URL for GET."""
         # Upload file
-        s3_handler.upload_file(local_path=sample_file, s3_key="presigned.txt")
+        s3_handler.upload_fileobj(BytesIO(SAMPLE_CONTENT), s3_key="presigned.txt")
 
         # Generate URL
         url = s3_handler.generate_presigned_url("presigned.txt", expiration=3600)
@@ -308,75 +422,77 @@ class TestS3HandlerPresignedURL:
         assert s3_handler.bucket_name in url
         assert "X-Amz-Expires=3600" in url or "Expires=" in url
 
-    def test_generate_presigned_url_put(self, s3_handler: S3Handler):
+    def test_generate_presigned_url_put(self, s3_handler: S3Handler, monkeypatch):
         """Test generating presigned URL for PUT."""
+        monkeypatch.setattr(s3_handler.s3_client, "generate_presigned_url", _canned_presigned_url)
+
         url = s3_handler.generate_presigned_url("new_file.txt", expiration=1800, http_method="PUT")
 
         assert isinstance(url, str)
         assert "new_file.txt" in url
 
-    def test_generate_presigned_url_custom_expiration(
-        self, s3_handler: S3Handler, sample_file: Path
-    ):
+    def test_generate_presigned_url_custom_expiration(self, s3_handler: S3Handler, monkeypatch):
         """Test presigned URL with custom expiration."""
-        s3_handler.upload_file(local_path=sample_file, s3_key="expiring.txt")
+        monkeypatch.setattr(s3_handler.s3_client, "generate_presigned_url", _canned_presigned_url)
 
         url = s3_handler.generate_presigned_url("expiring.txt", expiration=7200)
 
         assert isinstance(url, str)
         assert "expiring.txt" in url
+        assert "X-Amz-Expires=7200" in url
 
 
 class TestS3HandlerUtilities:
     """Tests for utility methods."""
 
-    def test_object_exists_true(self, s3_handler: S3Handler, sample_file: Path):
-        """Test object_exists returns True for existing object."""
-        s3_handler.upload_file(local_path=sample_file, s3_key="exists.txt")
-
-        assert s3_handler.object_exists("exists.txt") is True
-
     def test_object_exists_false(self, s3_handler: S3Handler):
         """Test object_exists returns False for non-existent object."""
         assert s3_handler.object_exists("does_not_exist.txt") is False
 
-    def test_get_object_metadata_success(self, s3_handler: S3Handler, sample_file: Path):
-        """Test getting object metadata."""
-        s3_handler.upload_file(
-            local_path=sample_file,
-            s3_key="metadata.txt",
-            metadata={"key1": "value1"},
-        )
-
-        metadata = s3_handler.get_object_metadata("metadata.txt")
-
-        assert metadata["key"] == "metadata.txt"
-        assert "size" in metadata
-        assert "last_modified" in metadata
-        assert "etag" in metadata
-        assert "content_type" in metadata
-        assert "custom_metadata" in metadata
-        assert metadata["custom_metadata"]["key1"] == "value1"
-
     def test_get_object_metadata_nonexistent(self, s3_handler: S3Handler):
         """Test getting metadata for non-existent object."""
         with pytest.raises(ClientError) as exc_info:
             s3_handler.get_object_metadata("nonexistent.txt")
 
-        assert exc_info.value.response["Error"]["Code"] in ["404", "NoSuchKey"]
+        assert exc_info.value.response["Error"]["Code"] in _NOT_FOUND_CODES
 
-    def test_calculate_file_hash(self, s3_handler: S3Handler, sample_file: Path):
+    def test_calculate_file_hash(self, s3_handler: S3Handler, sample_file: SampleFile):
         """Test MD5 hash calculation."""
-        calculated_hash = s3_handler._calculate_file_hash(sample_file)
+        calculated_hash = s3_handler._calculate_file_hash(sample_file.path)
 
         # Verify against manual calculation
-        md5_hash = hashlib.md5()
-        with open(sample_file, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                md5_hash.update(chunk)
-        expected_hash = md5_hash.hexdigest()
-
-        assert calculated_hash == expected_hash
+        assert calculated_hash == hashlib.md5(sample_file.data).hexdigest()
+
+
+class TestS3HandlerUploadedObject:
+    """Tests reading back a single shared uploaded object."""
+
+    @pytest.mark.parametrize(
+        "read_property, expected",
+        [
+            pytest.param(lambda h, key: h.object_exists(key), True, id="exists"),
+            pytest.param(
+                lambda h, key: h.get_object_metadata(key)["custom_metadata"],
+                UPLOADED_METADATA,
+                id="metadata",
+            ),
+            pytest.param(
+                lambda h, key: h.get_object_metadata(key)["content_type"],
+                "text/plain",
+                id="content_type",
+            ),
+            pytest.param(
+                lambda h, key: sorted(h.get_object_metadata(key)),
+                ["content_type", "custom_metadata", "etag", "key", "last_modified", "size"],
+                id="metadata_fields",
+            ),
+        ],
+    )
+    def test_uploaded_object_properties(self, uploaded_object, read_property, expected):
+        """Test properties of an object uploaded with metadata and content type."""
+        handler, result = uploaded_object
+
+        assert read_property(handler, result["key"]) == expected
 
 
 class TestS3HandlerErrorHandling:
@@ -441,11 +557,13 @@ class TestS3HandlerIntegration:
     """Integration tests combining multiple operations."""
 
     def test_upload_download_roundtrip(
-        self, s3_handler: S3Handler, sample_dicom_file: Path, tmp_path: Path
+        self, s3_handler: S3Handler, sample_dicom_file: SampleFile, tmp_path: Path
     ):
         """Test complete upload-download roundtrip preserves content."""
         # Upload
-        upload_result = s3_handler.upload_file(local_path=sample_dicom_file, s3_key="roundtrip.dcm")
+        upload_result = s3_handler.upload_file(
+            local_path=sample_dicom_file.path, s3_key="roundtrip.dcm"
+        )
 
         # Download
         download_path = tmp_path / "roundtrip_download.dcm"
@@ -454,16 +572,15 @@ class TestS3HandlerIntegration:
         )
 
         # Verify content matches
-        assert download_path.read_bytes() == sample_dicom_file.read_bytes()
+        assert download_path.read_bytes() == sample_dicom_file.data
         assert download_result["checksum_verified"] is True
         assert upload_result["checksum"] == download_result["checksum"]
 
-    def test_upload_list_delete_workflow(self, s3_handler: S3Handler, sample_file: Path):
+    def test_upload_list_delete_workflow(self, s3_handler: S3Handler):
         """Test typical workflow of upload, list, and delete."""
         # Upload multiple files
         keys = ["workflow1.txt", "workflow2.txt", "workflow3.txt"]
-        for key in keys:
-            s3_handler.upload_file(local_path=sample_file, s3_key=key)
+        _bulk_upload(s3_handler, keys)
 
         # List and verify all present
         objects = s3_handler.list_objects()
@@ -473,19 +590,13 @@ class TestS3HandlerIntegration:
         # Delete one
         s3_handler.delete_object("workflow2.txt")
 
-        # List again and verify deletion
-        objects = s3_handler.list_objects()
-        listed_keys = [obj["key"] for obj in objects]
-        assert "workflow1.txt" in listed_keys
-        assert "workflow2.txt" not in listed_keys
-        assert "workflow3.txt" in listed_keys
+        # Verify deletion
+        assert s3_handler.object_exists("workflow2.txt") is False
 
-    def test_presigned_url_generation_for_existing_file(
-        self, s3_handler: S3Handler, sample_file: Path
-    ):
+    def test_presigned_url_generation_for_existing_file(self, s3_handler: S3Handler):
         """Test presigned URL workflow for existing file."""
         # Upload
-        s3_handler.upload_file(local_path=sample_file, s3_key="presigned_flow.txt")
+        s3_handler.upload_fileobj(BytesIO(SAMPLE_CONTENT), s3_key="presigned_flow.txt")
 
         # Verify exists
         assert s3_handler.object_exists("presigned_flow.txt") is True
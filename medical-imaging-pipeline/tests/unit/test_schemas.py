@@ -20,6 +20,11 @@ from src.validation.schemas import (
 )
 
 
+def _has_error(exc: ValidationError, text: str) -> bool:
+    """Check error messages without rendering the full validation report."""
+    return any(text in error["msg"] for error in exc.errors())
+
+
 class TestPatientSchema:
     """Test cases for PatientSchema."""
 
@@ -41,33 +46,31 @@ class TestPatientSchema:
         with pytest.raises(ValidationError) as exc_info:
             PatientSchema(patient_id="")
 
-        assert "patient_id" in str(exc_info.value)
+        assert exc_info.value.errors()[0]["loc"] == ("patient_id",)
 
     def test_patient_id_whitespace_only_fails(self) -> None:
         """Test whitespace-only patient ID raises error."""
         with pytest.raises(ValidationError) as exc_info:
             PatientSchema(patient_id="   ")
 
-        assert "Patient ID cannot be empty or whitespace" in str(exc_info.value)
+        assert _has_error(exc_info.value, "Patient ID cannot be empty or whitespace")
 
-    def test_patient_sex_valid_values(self) -> None:
+    @pytest.mark.parametrize("sex", ["M", "F", "O"])
+    def test_patient_sex_valid_values(self, sex: str) -> None:
         """Test patient sex accepts valid values."""
-        for sex in ["M", "F", "O"]:
-            patient = PatientSchema(patient_id="test", patient_sex=sex)
-            assert patient.patient_sex == sex
+        patient = PatientSchema(patient_id="test", patient_sex=sex)
+        assert patient.patient_sex == sex
 
     def test_patient_sex_invalid_fails(self) -> None:
         """Test invalid patient sex raises error."""
         with pytest.raises(ValidationError):
             PatientSchema(patient_id="test", patient_sex="X")
 
-    def test_patient_age_format(self) -> None:
+    @pytest.mark.parametrize("age", ["045Y", "006M", "012W", "090D"])
+    def test_patient_age_format(self, age: str) -> None:
         """Test patient age format validation."""
-        valid_ages = ["045Y", "006M", "012W", "090D"]
-
-        for age in valid_ages:
-            patient = PatientSchema(patient_id="test", patient_age=age)
-            assert patient.patient_age == age
+        patient = PatientSchema(patient_id="test", patient_age=age)
+        assert patient.patient_age == age
 
     def test_patient_age_invalid_format_fails(self) -> None:
         """Test invalid age format raises error."""
@@ -79,7 +82,14 @@ class TestPatientSchema:
         with pytest.raises(ValidationError) as exc_info:
             PatientSchema(patient_id="test", patient_age="200Y")
 
-        assert "Age in years cannot exceed 150" in str(exc_info.value)
+        assert _has_error(exc_info.value, "Age in years cannot exceed 150")
+
+    def test_unknown_field_ignored(self) -> None:
+        """Test unknown fields are ignored rather than rejected."""
+        patient = PatientSchema(patient_id="test", patient_name="Doe^John")
+
+        assert patient.patient_id == "test"
+        assert not hasattr(patient, "patient_name")
 
     def test_patient_optional_fields(self) -> None:
         """Test patient with only required fields."""
@@ -106,30 +116,26 @@ class TestStudySchema:
         assert study.study_instance_uid == "1.2.3.4.5"
         assert study.study_date == "20250115"
 
-    def test_study_uid_format_valid(self) -> None:
+    @pytest.mark.parametrize("uid", ["1.2.3", "1.2.840.10008.5.1.4.1.1.2", "123.456.789.012345"])
+    def test_study_uid_format_valid(self, uid: str) -> None:
         """Test valid UID formats."""
-        valid_uids = ["1.2.3", "1.2.840.10008.5.1.4.1.1.2", "123.456.789.012345"]
-
-        for uid in valid_uids:
-            study = StudySchema(study_instance_uid=uid)
-            assert study.study_instance_uid == uid
+        study = StudySchema(study_instance_uid=uid)
+        assert study.study_instance_uid == uid
 
     def test_study_uid_invalid_characters_fails(self) -> None:
         """Test UID with invalid characters raises error."""
         with pytest.raises(ValidationError) as exc_info:
             StudySchema(study_instance_uid="1.2.abc.4")
 
-        assert "must contain only digits and dots" in str(exc_info.value)
+        assert _has_error(exc_info.value, "must contain only digits and dots")
 
-    def test_study_uid_invalid_dots_fails(self) -> None:
+    @pytest.mark.parametrize("uid", [".1.2.3", "1.2.3.", "1..2.3"])
+    def test_study_uid_invalid_dots_fails(self, uid: str) -> None:
         """Test UID with invalid dot placement raises error."""
-        invalid_uids = [".1.2.3", "1.2.3.", "1..2.3"]
-
-        for uid in invalid_uids:
-            with pytest.raises(ValidationError) as exc_info:
-                StudySchema(study_instance_uid=uid)
+        with pytest.raises(ValidationError) as exc_info:
+            StudySchema(study_instance_uid=uid)
 
-            assert "invalid dot placement" in str(exc_info.value)
+        assert _has_error(exc_info.value, "invalid dot placement")
 
     def test_study_date_format(self) -> None:
         """Test study date format validation."""
@@ -146,15 +152,23 @@ class TestStudySchema:
         with pytest.raises(ValidationError) as exc_info:
             StudySchema(study_instance_uid="1.2.3", study_date="20251332")
 
-        assert "Invalid study date format" in str(exc_info.value)
+        assert _has_error(exc_info.value, "Invalid study date format")
 
-    def test_study_time_format(self) -> None:
-        """Test study time format validation."""
-        valid_times = ["143000", "120000.123456"]
+    def test_study_date_leap_day(self) -> None:
+        """Test February 29 is only accepted in leap years."""
+        study = StudySchema(study_instance_uid="1.2.3", study_date="20240229")
+        assert study.study_date == "20240229"
+
+        with pytest.raises(ValidationError) as exc_info:
+            StudySchema(study_instance_uid="1.2.3", study_date="19000229")
+
+        assert _has_error(exc_info.value, "Invalid study date format")
 
-        for time in valid_times:
-            study = StudySchema(study_instance_uid="1.2.3", study_time=time)
-            assert study.study_time == time
+    @pytest.mark.parametrize("time", ["143000", "120000.123456"])
+    def test_study_time_format(self, time: str) -> None:
+        """Test study time format validation."""
+        study = StudySchema(study_instance_uid="1.2.3", study_time=time)
+        assert study.study_time == time
 
     def test_study_optional_fields(self) -> None:
         """Test study with only required fields."""
@@ -242,7 +256,7 @@ class TestImageMetadataSchema:
         with pytest.raises(ValidationError) as exc_info:
             ImageMetadataSchema(pixel_spacing=[0.5, 0.5, 0.5])
 
-        assert "must have exactly 2 elements" in str(exc_info.value)
+        assert _has_error(exc_info.value, "must have exactly 2 elements")
 
     def test_bits_relationship_valid(self) -> None:
         """Test bits_stored <= bits_allocated is valid."""
@@ -254,7 +268,7 @@ class TestImageMetadataSchema:
         with pytest.raises(ValidationError) as exc_info:
             ImageMetadataSchema(bits_allocated=12, bits_stored=16)
 
-        assert "bits_stored cannot exceed bits_allocated" in str(exc_info.value)
+        assert _has_error(exc_info.value, "bits_stored cannot exceed bits_allocated")
 
     def test_all_fields_optional(self) -> None:
         """Test all fields are optional."""
@@ -330,55 +344,139 @@ class TestDICOMInstanceSchema:
 class TestDICOMMetadataSchema:
     """Test cases for complete DICOMMetadataSchema."""
 
-    def test_valid_dicom_metadata(self) -> None:
+    def test_valid_dicom_metadata(
+        self,
+        base_patient: PatientSchema,
+        base_study: StudySchema,
+        base_series_ct: SeriesSchema,
+        base_instance: DICOMInstanceSchema,
+    ) -> None:
         """Test creating valid complete DICOM metadata."""
         metadata = DICOMMetadataSchema(
-            patient=PatientSchema(patient_id="test123"),
-            study=StudySchema(study_instance_uid="1.2.3"),
-            series=SeriesSchema(series_instance_uid="1.2.3.4", modality="CT"),
-            instance=DICOMInstanceSchema(sop_instance_uid="1.2.3.4.5", sop_class_uid="1.2.840"),
+            patient=base_patient, study=base_study, series=base_series_ct, instance=base_instance
         )
 
-        assert metadata.patient.patient_id == "test123"
+        assert metadata.patient.patient_id == "test"
         assert metadata.series.modality == "CT"
 
-    def test_dicom_with_ct_metadata(self) -> None:
+    def test_dicom_with_ct_metadata(
+        self,
+        base_patient: PatientSchema,
+        base_study: StudySchema,
+        base_series_ct: SeriesSchema,
+        base_instance: DICOMInstanceSchema,
+    ) -> None:
         """Test DICOM with CT-specific metadata."""
         metadata = DICOMMetadataSchema(
-            patient=PatientSchema(patient_id="test"),
-            study=StudySchema(study_instance_uid="1.2.3"),
-            series=SeriesSchema(series_instance_uid="1.2.3.4", modality="CT"),
-            instance=DICOMInstanceSchema(sop_instance_uid="1.2.3.4.5", sop_class_uid="1.2.840"),
-            ct_metadata=CTMetadataSchema(kvp=120),
+            patient=base_patient,
+            study=base_study,
+            series=base_series_ct,
+            instance=base_instance,
+            modality_metadata=CTMetadataSchema(kvp=120),
         )
 
-        assert metadata.ct_metadata.kvp == 120
+        assert metadata.modality_metadata.kvp == 120
+
+    def test_modality_metadata_dispatches_on_tag(
+        self,
+        base_patient: PatientSchema,
+        base_study: StudySchema,
+        base_series_mr: SeriesSchema,
+        base_instance: DICOMInstanceSchema,
+    ) -> None:
+        """Test raw modality metadata is validated against the tagged schema."""
+        metadata = DICOMMetadataSchema(
+            patient=base_patient,
+            study=base_study,
+            series=base_series_mr,
+            instance=base_instance,
+            modality_metadata={"modality_tag": "MR", "echo_time": 10},
+        )
 
-    def test_ct_with_mr_metadata_fails(self) -> None:
+        assert isinstance(metadata.modality_metadata, MRMetadataSchema)
+        assert metadata.modality_metadata.echo_time == 10
+
+    def test_ct_with_mr_metadata_fails(
+        self,
+        base_patient: PatientSchema,
+        base_study: StudySchema,
+        base_series_ct: SeriesSchema,
+        base_instance: DICOMInstanceSchema,
+    ) -> None:
         """Test CT modality with MR metadata raises error."""
         with pytest.raises(ValidationError) as exc_info:
             DICOMMetadataSchema(
-                patient=PatientSchema(patient_id="test"),
-                study=StudySchema(study_instance_uid="1.2.3"),
-                series=SeriesSchema(series_instance_uid="1.2.3.4", modality="CT"),
-                instance=DICOMInstanceSchema(sop_instance_uid="1.2.3.4.5", sop_class_uid="1.2.840"),
-                mr_metadata=MRMetadataSchema(repetition_time=500),
+                patient=base_patient,
+                study=base_study,
+                series=base_series_ct,
+                instance=base_instance,
+                modality_metadata=MRMetadataSchema(repetition_time=500),
             )
 
-        assert "CT modality should not have MR metadata" in str(exc_info.value)
+        assert _has_error(exc_info.value, "CT modality should not have MR metadata")
 
-    def test_mr_with_ct_metadata_fails(self) -> None:
+    def test_mr_with_ct_metadata_fails(
+        self,
+        base_patient: PatientSchema,
+        base_study: StudySchema,
+        base_series_mr: SeriesSchema,
+        base_instance: DICOMInstanceSchema,
+    ) -> None:
         """Test MR modality with CT metadata raises error."""
         with pytest.raises(ValidationError) as exc_info:
             DICOMMetadataSchema(
-                patient=PatientSchema(patient_id="test"),
-                study=StudySchema(study_instance_uid="1.2.3"),
-                series=SeriesSchema(series_instance_uid="1.2.3.4", modality="MR"),
-                instance=DICOMInstanceSchema(sop_instance_uid="1.2.3.4.5", sop_class_uid="1.2.840"),
-                ct_metadata=CTMetadataSchema(kvp=120),
+                patient=base_patient,
+                study=base_study,
+                series=base_series_mr,
+                instance=base_instance,
+                modality_metadata=CTMetadataSchema(kvp=120),
             )
 
-        assert "MR modality should not have CT metadata" in str(exc_info.value)
+        assert _has_error(exc_info.value, "MR modality should not have CT metadata")
+
+    def test_assemble_from_validated_parts(
+        self,
+        base_patient: PatientSchema,
+        base_study: StudySchema,
+        base_series_ct: SeriesSchema,
+        base_instance: DICOMInstanceSchema,
+    ) -> None:
+        """Test assembling metadata from already-validated sub-schemas."""
+        metadata = DICOMMetadataSchema.assemble(
+            patient=base_patient,
+            study=base_study,
+            series=base_series_ct,
+            instance=base_instance,
+            modality_metadata=CTMetadataSchema(kvp=120),
+        )
+
+        assert metadata.modality_metadata.kvp == 120
+        assert metadata.model_fields_set == {
+            "patient",
+            "study",
+            "series",
+            "instance",
+            "modality_metadata",
+        }
+
+    def test_assemble_still_checks_modality(
+        self,
+        base_patient: PatientSchema,
+        base_study: StudySchema,
+        base_series_mr: SeriesSchema,
+        base_instance: DICOMInstanceSchema,
+    ) -> None:
+        """Test assemble applies the modality cross-check."""
+        with pytest.raises(ValidationError) as exc_info:
+            DICOMMetadataSchema.assemble(
+                patient=base_patient,
+                study=base_study,
+                series=base_series_mr,
+                instance=base_instance,
+                modality_metadata=CTMetadataSchema(kvp=120),
+            )
+
+        assert _has_error(exc_info.value, "MR modality should not have CT metadata")
 
 
 class TestCSVRecordSchema:
@@ -412,15 +510,15 @@ class TestCSVRecordSchema:
         with pytest.raises(ValidationError) as exc_info:
             CSVRecordSchema(patient_id="P001", study_date="2025-13-45", modality="CT")
 
-        assert "Invalid date format" in str(exc_info.value)
+        assert _has_error(exc_info.value, "Invalid date format")
 
-    def test_status_validation(self) -> None:
+    @pytest.mark.parametrize("status", ["pending", "completed", "failed"])
+    def test_status_validation(self, status: str) -> None:
         """Test status validation."""
-        for status in ["pending", "completed", "failed"]:
-            record = CSVRecordSchema(
-                patient_id="P001", study_date="2025-01-15", modality="CT", status=status
-            )
-            assert record.status == status
+        record = CSVRecordSchema(
+            patient_id="P001", study_date="2025-01-15", modality="CT", status=status
+        )
+        assert record.status == status
 
     def test_invalid_status_fails(self) -> None:
         """Test invalid status raises error."""
@@ -438,7 +536,7 @@ class TestDeliveryFileSchema:
         file = DeliveryFileSchema(
             file_path="s3://bucket/file.dcm",
             file_size=1024,
-            checksum="abc123def456" * 3,
+            checksum="abc123de" * 8,
             presigned_url="https://s3.amazonaws.com/...",
             url_expiration="2025-01-15T12:00:00Z",
         )
@@ -455,6 +553,18 @@ class TestDeliveryFileSchema:
         with pytest.raises(ValidationError):
             DeliveryFileSchema(file_path="test.txt", file_size=-1, checksum="a" * 32)
 
+    def test_presigned_url_requires_http_scheme(self) -> None:
+        """Test presigned URL without an http(s) scheme raises error."""
+        with pytest.raises(ValidationError) as exc_info:
+            DeliveryFileSchema(
+                file_path="test.txt",
+                file_size=100,
+                checksum="a" * 32,
+                presigned_url="s3://bucket/test.txt",
+            )
+
+        assert exc_info.value.errors()[0]["loc"] == ("presigned_url",)
+
     def test_checksum_length(self) -> None:
         """Test checksum length validation."""
         # MD5 (32 chars)
@@ -470,6 +580,21 @@ class TestDeliveryFileSchema:
         with pytest.raises(ValidationError):
             DeliveryFileSchema(file_path="test.txt", file_size=100, checksum="abc123")
 
+    def test_checksum_unsupported_length_fails(self) -> None:
+        """Test checksum between digest lengths raises error."""
+        with pytest.raises(ValidationError) as exc_info:
+            DeliveryFileSchema(file_path="test.txt", file_size=100, checksum="a" * 36)
+
+        assert _has_error(exc_info.value, "Checksum length must be one of")
+
+    @pytest.mark.parametrize("checksum", ["g" * 32, "aa " * 10 + "aa"])
+    def test_checksum_non_hex_fails(self, checksum: str) -> None:
+        """Test checksum with non-hex or whitespace characters raises error."""
+        with pytest.raises(ValidationError) as exc_info:
+            DeliveryFileSchema(file_path="test.txt", file_size=100, checksum=checksum)
+
+        assert _has_error(exc_info.value, "hexadecimal")
+
 
 class TestDeliveryManifestSchema:
     """Test cases for DeliveryManifestSchema."""
@@ -492,16 +617,34 @@ class TestDeliveryManifestSchema:
         assert manifest.total_files == 2
         assert len(manifest.files) == 2
 
-    def test_timestamp_validation(self) -> None:
-        """Test ISO 8601 timestamp validation."""
-        timestamps = [
+    @pytest.mark.parametrize(
+        "ts",
+        [
             "2025-01-15T12:00:00Z",
             "2025-01-15T12:00:00+00:00",
             "2025-01-15T12:00:00.123456Z",
-        ]
+        ],
+    )
+    def test_timestamp_validation(self, ts: str) -> None:
+        """Test ISO 8601 timestamp validation."""
+        manifest = DeliveryManifestSchema(
+            manifest_id="MAN123",
+            created_at=ts,
+            patient_id="P001",
+            study_instance_uid="1.2.3",
+            total_files=0,
+            total_size_bytes=0,
+            files=[],
+        )
+        assert manifest.created_at == ts
 
-        for ts in timestamps:
-            manifest = DeliveryManifestSchema(
+    @pytest.mark.parametrize(
+        "ts", ["2025-01-15 12:00:00", "2024-01-01T00:00:00Z\n"], ids=["space", "trailing_newline"]
+    )
+    def test_invalid_timestamp_fails(self, ts: str) -> None:
+        """Test invalid timestamp raises error."""
+        with pytest.raises(ValidationError) as exc_info:
+            DeliveryManifestSchema(
                 manifest_id="MAN123",
                 created_at=ts,
                 patient_id="P001",
@@ -510,14 +653,18 @@ class TestDeliveryManifestSchema:
                 total_size_bytes=0,
                 files=[],
             )
-            assert manifest.created_at == ts
 
-    def test_invalid_timestamp_fails(self) -> None:
-        """Test invalid timestamp raises error."""
+        assert _has_error(exc_info.value, "Invalid ISO 8601 timestamp")
+
+    @pytest.mark.parametrize(
+        "ts", ["2025-02-30T12:00:00Z", "2025-01-15T24:00:00Z", "2025-01-15T12:00:00+24:00"]
+    )
+    def test_out_of_range_timestamp_fails(self, ts: str) -> None:
+        """Test well-formed timestamp with out-of-range fields raises error."""
         with pytest.raises(ValidationError) as exc_info:
             DeliveryManifestSchema(
                 manifest_id="MAN123",
-                created_at="2025-01-15 12:00:00",
+                created_at=ts,
                 patient_id="P001",
                 study_instance_uid="1.2.3",
                 total_files=0,
@@ -525,7 +672,7 @@ class TestDeliveryManifestSchema:
                 files=[],
             )
 
-        assert "Invalid ISO 8601 timestamp" in str(exc_info.value)
+        assert _has_error(exc_info.value, "Invalid ISO 8601 timestamp")
 
     def test_file_count_mismatch_fails(self) -> None:
         """Test file count mismatch raises error."""
@@ -542,7 +689,7 @@ class TestDeliveryManifestSchema:
                 ],  # But only 1
             )
 
-        assert "does not match actual file count" in str(exc_info.value)
+        assert _has_error(exc_info.value, "does not match actual file count")
 
     def test_empty_files_list_valid(self) -> None:
         """Test empty files list is valid."""
@@ -5,49 +5,168 @@ Tests Step Functions workflow orchestration with mocked AWS services.
 """
 
 import json
+from datetime import datetime, timezone
+from functools import partial
+from unittest.mock import MagicMock
 
+import boto3
 import pytest
 from botocore.exceptions import ClientError
 from moto import mock_aws
 
 from src.orchestration.step_functions import StepFunctionsHandler
 
+# Every test here is fully mocked, so keep boto3's default session between mocks
+MOTO_CONFIG = {"core": {"reset_boto3_session": False}}
+
+STATE_MACHINE_DEFINITION = {
+    "Comment": "Test state machine",
+    "StartAt": "TestState",
+    "States": {
+        "TestState": {
+            "Type": "Pass",
+            "Result": "Hello World",
+            "End": True,
+        }
+    },
+}
+STATE_MACHINE_DEFINITION_JSON = json.dumps(STATE_MACHINE_DEFINITION)
+
+
+def _client_error(operation_name, code, message):
+    """Build the (error_response, operation_name) pair ClientError is raised with."""
+    return {"Error": {"Code": code, "Message": message}}, operation_name
+
+
+CREATE_STATE_MACHINE_ERROR = _client_error(
+    "CreateStateMachine", "InvalidDefinition", "Invalid definition"
+)
+START_EXECUTION_ERROR = _client_error(
+    "StartExecution", "StateMachineDoesNotExist", "State machine does not exist"
+)
+DESCRIBE_EXECUTION_ERROR = _client_error(
+    "DescribeExecution", "ExecutionDoesNotExist", "Execution does not exist"
+)
+LIST_EXECUTIONS_ERROR = _client_error("ListExecutions", "InvalidArn", "Invalid state machine ARN")
+STOP_EXECUTION_ERROR = _client_error(
+    "StopExecution", "ExecutionDoesNotExist", "Execution does not exist"
+)
+DESCRIBE_STATE_MACHINE_ERROR = _client_error(
+    "DescribeStateMachine", "StateMachineDoesNotExist", "State machine does not exist"
+)
+DELETE_STATE_MACHINE_ERROR = _client_error(
+    "DeleteStateMachine", "StateMachineDoesNotExist", "State machine does not exist"
+)
+
+
+def _raise_client_error(error, *args, **kwargs):
+    """Stand-in client method; bind ``error`` with functools.partial."""
+    raise ClientError(*error)
+
+
+@pytest.fixture(scope="session")
+def aws_credentials():
+    """Mock AWS credentials for testing, set once for the whole session."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("AWS_ACCESS_KEY_ID", "testing")
+        mp.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+        mp.setenv("AWS_SECURITY_TOKEN", "testing")
+        mp.setenv("AWS_SESSION_TOKEN", "testing")
+        mp.setenv("AWS_DEFAULT_REGION", "us-east-1")
+        yield
+
+
+@pytest.fixture(scope="session")
+def _sfn_client_cached(aws_credentials):
+    """
+    Build one Step Functions client for the whole session.
+
+    moto intercepts requests from any client while a mock is active, so the
+    per-class mocks below can share it instead of each building a new client.
+    """
+    return boto3.Session(region_name="us-east-1").client("stepfunctions")
+
+
+@pytest.fixture(scope="class")
+def step_functions_handler(_sfn_client_cached):
+    """
+    Create one StepFunctionsHandler per test class inside a mocked AWS context.
+
+    Class scope (not session) closes the mock before another module's tests run
+    on the same xdist worker, so their own mock_aws() contexts still reset state.
+    """
+    with mock_aws(config=MOTO_CONFIG):
+        handler = StepFunctionsHandler(region_name="us-east-1", sfn_client=_sfn_client_cached)
+        yield handler
 
-@pytest.fixture
-def aws_credentials(monkeypatch):
-    """Mock AWS credentials for testing."""
-    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
-    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
-    monkeypatch.setenv("AWS_SECURITY_TOKEN", "testing")
-    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
-    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
 
+@pytest.fixture(scope="class")
+def shared_state_machine_arn(step_functions_handler, state_machine_definition, role_arn):
+    """Create one state machine per class for tests that do not delete it."""
+    return step_functions_handler.create_state_machine(
+        name="test-shared-state-machine",
+        definition=state_machine_definition,
+        role_arn=role_arn,
+    )["state_machine_arn"]
 
-@pytest.fixture
-def step_functions_handler(aws_credentials):
-    """Create StepFunctionsHandler with mocked AWS."""
-    with mock_aws():
-        handler = StepFunctionsHandler(region_name="us-east-1")
-        yield handler
+
+@pytest.fixture(autouse=True)
+def _delete_state_machines(request):
+    """Delete state machines a test created so the shared mock backend stays clean."""
+    if "step_functions_handler" not in request.fixturenames:
+        yield
+        return
+
+    # Build the class-scoped shared state machine first so it is not treated as new
+    if "shared_state_machine_arn" in request.fixturenames:
+        request.getfixturevalue("shared_state_machine_arn")
+
+    sfn_client = request.getfixturevalue("step_functions_handler").sfn_client
+    existing = {sm["stateMachineArn"] for sm in sfn_client.list_state_machines()["stateMachines"]}
+    yield
+
+    for state_machine in sfn_client.list_state_machines()["stateMachines"]:
+        if state_machine["stateMachineArn"] not in existing:
+            sfn_client.delete_state_machine(stateMachineArn=state_machine["stateMachineArn"])
 
 
 @pytest.fixture
-def state_machine_definition():
-    """Create minimal state machine definition."""
-    return {
-        "Comment": "Test state machine",
-        "StartAt": "TestState",
-        "States": {
-            "TestState": {
-                "Type": "Pass",
-                "Result": "Hello World",
-                "End": True,
-            }
-        },
+def stub_sfn_client(step_functions_handler, monkeypatch):
+    """Swap the handler's client for a MagicMock in tests that only check passthrough."""
+    sfn_client = MagicMock()
+    sfn_client.create_state_machine.return_value = {
+        "stateMachineArn": "arn:aws:states:us-east-1:123456789012:stateMachine:test",
+        "creationDate": datetime(2025, 1, 15, tzinfo=timezone.utc),
     }
+    monkeypatch.setattr(step_functions_handler, "sfn_client", sfn_client)
+    return sfn_client
 
 
 @pytest.fixture
+def inject_client_error(step_functions_handler, monkeypatch):
+    """Return a helper that makes one SFN client method raise a ClientError."""
+
+    def inject(method_name, error):
+        monkeypatch.setattr(
+            step_functions_handler.sfn_client, method_name, partial(_raise_client_error, error)
+        )
+
+    return inject
+
+
+@pytest.fixture(scope="session")
+def state_machine_definition():
+    """Minimal state machine definition."""
+    return STATE_MACHINE_DEFINITION
+
+
+@pytest.fixture(scope="session")
+def state_machine_definition_json():
+    """Minimal state machine definition, serialized once."""
+    return STATE_MACHINE_DEFINITION_JSON
+
+
+@pytest.fixture(scope="session")
 def role_arn():
     """Mock IAM role ARN."""
     return "arn:aws:iam::123456789012:role/StepFunctionsRole"
@@ -58,14 +177,14 @@ class TestStepFunctionsHandlerInitialization:
 
     def test_init_with_default_credentials(self, aws_credentials):
         """Test initialization with default credentials."""
-        with mock_aws():
+        with mock_aws(config=MOTO_CONFIG):
             handler = StepFunctionsHandler(region_name="us-east-1")
             assert handler.region_name == "us-east-1"
             assert handler.sfn_client is not None
 
     def test_init_with_custom_credentials(self, aws_credentials):
         """Test initialization with custom credentials."""
-        with mock_aws():
+        with mock_aws(config=MOTO_CONFIG):
             handler = StepFunctionsHandler(
                 region_name="us-west-2",
                 aws_access_key_id="custom_key",
@@ -74,6 +193,13 @@ class TestStepFunctionsHandlerInitialization:
             assert handler.region_name == "us-west-2"
             assert handler.sfn_client is not None
 
+    def test_init_with_injected_client(self, _sfn_client_cached):
+        """Test an injected client is used as-is instead of building a new one."""
+        handler = StepFunctionsHandler(region_name="eu-west-1", sfn_client=_sfn_client_cached)
+
+        assert handler.region_name == "eu-west-1"
+        assert handler.sfn_client is _sfn_client_cached
+
 
 class TestStateMachineCreation:
     """Test state machine creation."""
@@ -93,7 +219,7 @@ class TestStateMachineCreation:
         assert "test-state-machine" in result["state_machine_arn"]
 
     def test_create_state_machine_with_logging(
-        self, step_functions_handler, state_machine_definition, role_arn
+        self, step_functions_handler, stub_sfn_client, state_machine_definition, role_arn
     ):
         """Test state machine creation with logging configuration."""
         logging_config = {
@@ -119,9 +245,11 @@ class TestStateMachineCreation:
         )
 
         assert "state_machine_arn" in result
+        create_kwargs = stub_sfn_client.create_state_machine.call_args.kwargs
+        assert create_kwargs["loggingConfiguration"] == logging_config
 
     def test_create_state_machine_with_tags(
-        self, step_functions_handler, state_machine_definition, role_arn
+        self, step_functions_handler, stub_sfn_client, state_machine_definition, role_arn
     ):
         """Test state machine creation with tags."""
         tags = [
@@ -137,65 +265,31 @@ class TestStateMachineCreation:
         )
 
         assert "state_machine_arn" in result
+        assert stub_sfn_client.create_state_machine.call_args.kwargs["tags"] == tags
 
     def test_create_state_machine_with_string_definition(
-        self, step_functions_handler, state_machine_definition, role_arn
+        self, step_functions_handler, stub_sfn_client, state_machine_definition_json, role_arn
     ):
         """Test state machine creation with string definition."""
-        definition_str = json.dumps(state_machine_definition)
-
         result = step_functions_handler.create_state_machine(
             name="test-state-machine-string-def",
-            definition=definition_str,
+            definition=state_machine_definition_json,
             role_arn=role_arn,
         )
 
         assert "state_machine_arn" in result
-
-    def test_create_state_machine_failure(
-        self, step_functions_handler, state_machine_definition, monkeypatch
-    ):
-        """Test state machine creation failure."""
-
-        def mock_create_state_machine(*args, **kwargs):
-            error_response = {
-                "Error": {"Code": "InvalidDefinition", "Message": "Invalid definition"}
-            }
-            raise ClientError(error_response, "CreateStateMachine")
-
-        monkeypatch.setattr(
-            step_functions_handler.sfn_client,
-            "create_state_machine",
-            mock_create_state_machine,
-        )
-
-        with pytest.raises(ClientError):
-            step_functions_handler.create_state_machine(
-                name="test-failing-state-machine",
-                definition=state_machine_definition,
-                role_arn="arn:aws:iam::123456789012:role/TestRole",
-            )
+        create_kwargs = stub_sfn_client.create_state_machine.call_args.kwargs
+        assert create_kwargs["definition"] == state_machine_definition_json
 
 
 class TestExecutionManagement:
     """Test execution management."""
 
-    def test_start_execution_success(
-        self, step_functions_handler, state_machine_definition, role_arn
-    ):
+    def test_start_execution_success(self, step_functions_handler, shared_state_machine_arn):
         """Test starting execution successfully."""
-        # Create state machine first
-        create_result = step_functions_handler.create_state_machine(
-            name="test-state-machine-exec",
-            definition=state_machine_definition,
-            role_arn=role_arn,
-        )
-        state_machine_arn = create_result["state_machine_arn"]
-
-        # Start execution
         execution_input = {"key": "value", "number": 123}
         result = step_functions_handler.start_execution(
-            state_machine_arn=state_machine_arn,
+            state_machine_arn=shared_state_machine_arn,
             execution_input=execution_input,
         )
 
@@ -222,43 +316,10 @@ class TestExecutionManagement:
         assert "execution_arn" in result
         assert "test-execution-001" in result["execution_arn"]
 
-    def test_start_execution_failure(self, step_functions_handler, monkeypatch):
-        """Test execution start failure."""
-
-        def mock_start_execution(*args, **kwargs):
-            error_response = {
-                "Error": {
-                    "Code": "StateMachineDoesNotExist",
-                    "Message": "State machine does not exist",
-                }
-            }
-            raise ClientError(error_response, "StartExecution")
-
-        monkeypatch.setattr(
-            step_functions_handler.sfn_client,
-            "start_execution",
-            mock_start_execution,
-        )
-
-        with pytest.raises(ClientError):
-            step_functions_handler.start_execution(
-                state_machine_arn="arn:aws:states:us-east-1:123456789012:stateMachine:NonExistent",
-                execution_input={},
-            )
-
-    def test_describe_execution_success(
-        self, step_functions_handler, state_machine_definition, role_arn
-    ):
+    def test_describe_execution_success(self, step_functions_handler, shared_state_machine_arn):
         """Test describing execution."""
-        create_result = step_functions_handler.create_state_machine(
-            name="test-state-machine-describe",
-            definition=state_machine_definition,
-            role_arn=role_arn,
-        )
-        state_machine_arn = create_result["state_machine_arn"]
-
         start_result = step_functions_handler.start_execution(
-            state_machine_arn=state_machine_arn,
+            state_machine_arn=shared_state_machine_arn,
             execution_input={"test": "data"},
         )
         execution_arn = start_result["execution_arn"]
@@ -266,34 +327,11 @@ class TestExecutionManagement:
         result = step_functions_handler.describe_execution(execution_arn=execution_arn)
 
         assert result["execution_arn"] == execution_arn
-        assert result["state_machine_arn"] == state_machine_arn
+        assert result["state_machine_arn"] == shared_state_machine_arn
         assert "status" in result
         assert "start_date" in result
         assert "input" in result
 
-    def test_describe_execution_failure(self, step_functions_handler, monkeypatch):
-        """Test describe execution failure."""
-
-        def mock_describe_execution(*args, **kwargs):
-            error_response = {
-                "Error": {
-                    "Code": "ExecutionDoesNotExist",
-                    "Message": "Execution does not exist",
-                }
-            }
-            raise ClientError(error_response, "DescribeExecution")
-
-        monkeypatch.setattr(
-            step_functions_handler.sfn_client,
-            "describe_execution",
-            mock_describe_execution,
-        )
-
-        with pytest.raises(ClientError):
-            step_functions_handler.describe_execution(
-                execution_arn="arn:aws:states:us-east-1:123456789012:execution:test:nonexistent"
-            )
-
     def test_list_executions_success(
         self, step_functions_handler, state_machine_definition, role_arn
     ):
@@ -320,63 +358,24 @@ class TestExecutionManagement:
             assert "execution_arn" in execution
             assert "status" in execution
 
-    def test_list_executions_with_filter(
-        self, step_functions_handler, state_machine_definition, role_arn
-    ):
+    def test_list_executions_with_filter(self, step_functions_handler, shared_state_machine_arn):
         """Test listing executions with status filter."""
-        create_result = step_functions_handler.create_state_machine(
-            name="test-state-machine-list-filter",
-            definition=state_machine_definition,
-            role_arn=role_arn,
-        )
-        state_machine_arn = create_result["state_machine_arn"]
-
         step_functions_handler.start_execution(
-            state_machine_arn=state_machine_arn,
+            state_machine_arn=shared_state_machine_arn,
             execution_input={"test": "data"},
         )
 
         result = step_functions_handler.list_executions(
-            state_machine_arn=state_machine_arn,
+            state_machine_arn=shared_state_machine_arn,
             status_filter="RUNNING",
         )
 
         assert isinstance(result, list)
 
-    def test_list_executions_failure(self, step_functions_handler, monkeypatch):
-        """Test list executions failure."""
-
-        def mock_list_executions(*args, **kwargs):
-            error_response = {
-                "Error": {
-                    "Code": "InvalidArn",
-                    "Message": "Invalid state machine ARN",
-                }
-            }
-            raise ClientError(error_response, "ListExecutions")
-
-        monkeypatch.setattr(
-            step_functions_handler.sfn_client,
-            "list_executions",
-            mock_list_executions,
-        )
-
-        with pytest.raises(ClientError):
-            step_functions_handler.list_executions(state_machine_arn="invalid-arn")
-
-    def test_stop_execution_success(
-        self, step_functions_handler, state_machine_definition, role_arn
-    ):
+    def test_stop_execution_success(self, step_functions_handler, shared_state_machine_arn):
         """Test stopping execution."""
-        create_result = step_functions_handler.create_state_machine(
-            name="test-state-machine-stop",
-            definition=state_machine_definition,
-            role_arn=role_arn,
-        )
-        state_machine_arn = create_result["state_machine_arn"]
-
         start_result = step_functions_handler.start_execution(
-            state_machine_arn=state_machine_arn,
+            state_machine_arn=shared_state_machine_arn,
             execution_input={"test": "data"},
         )
         execution_arn = start_result["execution_arn"]
@@ -389,74 +388,23 @@ class TestExecutionManagement:
 
         assert "stop_date" in result
 
-    def test_stop_execution_failure(self, step_functions_handler, monkeypatch):
-        """Test stop execution failure."""
-
-        def mock_stop_execution(*args, **kwargs):
-            error_response = {
-                "Error": {
-                    "Code": "ExecutionDoesNotExist",
-                    "Message": "Execution does not exist",
-                }
-            }
-            raise ClientError(error_response, "StopExecution")
-
-        monkeypatch.setattr(
-            step_functions_handler.sfn_client,
-            "stop_execution",
-            mock_stop_execution,
-        )
-
-        with pytest.raises(ClientError):
-            step_functions_handler.stop_execution(
-                execution_arn="arn:aws:states:us-east-1:123456789012:execution:test:nonexistent"
-            )
-
 
 class TestStateMachineManagement:
     """Test state machine management operations."""
 
     def test_describe_state_machine_success(
-        self, step_functions_handler, state_machine_definition, role_arn
+        self, step_functions_handler, shared_state_machine_arn, role_arn
     ):
         """Test describing state machine."""
-        create_result = step_functions_handler.create_state_machine(
-            name="test-state-machine-describe-sm",
-            definition=state_machine_definition,
-            role_arn=role_arn,
+        result = step_functions_handler.describe_state_machine(
+            state_machine_arn=shared_state_machine_arn
         )
-        state_machine_arn = create_result["state_machine_arn"]
-
-        result = step_functions_handler.describe_state_machine(state_machine_arn=state_machine_arn)
 
-        assert result["state_machine_arn"] == state_machine_arn
-        assert result["name"] == "test-state-machine-describe-sm"
+        assert result["state_machine_arn"] == shared_state_machine_arn
+        assert result["name"] == "test-shared-state-machine"
         assert "definition" in result
         assert result["role_arn"] == role_arn
 
-    def test_describe_state_machine_failure(self, step_functions_handler, monkeypatch):
-        """Test describe state machine failure."""
-
-        def mock_describe_state_machine(*args, **kwargs):
-            error_response = {
-                "Error": {
-                    "Code": "StateMachineDoesNotExist",
-                    "Message": "State machine does not exist",
-                }
-            }
-            raise ClientError(error_response, "DescribeStateMachine")
-
-        monkeypatch.setattr(
-            step_functions_handler.sfn_client,
-            "describe_state_machine",
-            mock_describe_state_machine,
-        )
-
-        with pytest.raises(ClientError):
-            step_functions_handler.describe_state_machine(
-                state_machine_arn="arn:aws:states:us-east-1:123456789012:stateMachine:nonexistent"
-            )
-
     def test_delete_state_machine_success(
         self, step_functions_handler, state_machine_definition, role_arn
     ):
@@ -472,28 +420,76 @@ class TestStateMachineManagement:
 
         assert result is True
 
-    def test_delete_state_machine_failure(self, step_functions_handler, monkeypatch):
-        """Test delete state machine failure."""
 
-        def mock_delete_state_machine(*args, **kwargs):
-            error_response = {
-                "Error": {
-                    "Code": "StateMachineDoesNotExist",
-                    "Message": "State machine does not exist",
-                }
-            }
-            raise ClientError(error_response, "DeleteStateMachine")
+class TestClientErrors:
+    """Test that SFN client errors propagate from every handler operation."""
 
-        monkeypatch.setattr(
-            step_functions_handler.sfn_client,
-            "delete_state_machine",
-            mock_delete_state_machine,
-        )
+    NONEXISTENT_STATE_MACHINE = "arn:aws:states:us-east-1:123456789012:stateMachine:nonexistent"
+    NONEXISTENT_EXECUTION = "arn:aws:states:us-east-1:123456789012:execution:test:nonexistent"
 
-        with pytest.raises(ClientError):
-            step_functions_handler.delete_state_machine(
-                state_machine_arn="arn:aws:states:us-east-1:123456789012:stateMachine:nonexistent"
-            )
+    @pytest.mark.parametrize(
+        "method_name, error, call_kwargs",
+        [
+            pytest.param(
+                "create_state_machine",
+                CREATE_STATE_MACHINE_ERROR,
+                {
+                    "name": "test-failing-state-machine",
+                    "definition": STATE_MACHINE_DEFINITION,
+                    "role_arn": "arn:aws:iam::123456789012:role/TestRole",
+                },
+                id="create_state_machine",
+            ),
+            pytest.param(
+                "start_execution",
+                START_EXECUTION_ERROR,
+                {"state_machine_arn": NONEXISTENT_STATE_MACHINE, "execution_input": {}},
+                id="start_execution",
+            ),
+            pytest.param(
+                "describe_execution",
+                DESCRIBE_EXECUTION_ERROR,
+                {"execution_arn": NONEXISTENT_EXECUTION},
+                id="describe_execution",
+            ),
+            pytest.param(
+                "list_executions",
+                LIST_EXECUTIONS_ERROR,
+                {"state_machine_arn": "invalid-arn"},
+                id="list_executions",
+            ),
+            pytest.param(
+                "stop_execution",
+                STOP_EXECUTION_ERROR,
+                {"execution_arn": NONEXISTENT_EXECUTION},
+                id="stop_execution",
+            ),
+            pytest.param(
+                "describe_state_machine",
+                DESCRIBE_STATE_MACHINE_ERROR,
+                {"state_machine_arn": NONEXISTENT_STATE_MACHINE},
+                id="describe_state_machine",
+            ),
+            pytest.param(
+                "delete_state_machine",
+                DELETE_STATE_MACHINE_ERROR,
+                {"state_machine_arn": NONEXISTENT_STATE_MACHINE},
+                id="delete_state_machine",
+            ),
+        ],
+    )
+    def test_client_error_propagates(
+        self, step_functions_handler, inject_client_error, method_name, error, call_kwargs
+    ):
+        """Test handler operation re-raises the client's ClientError."""
+        inject_client_error(method_name, error)
+
+        with pytest.raises(ClientError) as exc_info:
+            getattr(step_functions_handler, method_name)(**call_kwargs)
+
+        error_response, operation_name = error
+        assert exc_info.value.response["Error"] == error_response["Error"]
+        assert exc_info.value.operation_name == operation_name
 
 
 class TestStateMachineDefinitionHelpers:
@@ -530,6 +526,16 @@ class TestStateMachineDefinitionHelpers:
         with pytest.raises(json.JSONDecodeError):
             StepFunctionsHandler.load_state_machine_definition(str(invalid_file))
 
+    def test_load_state_machine_definition_without_orjson(self, tmp_path, monkeypatch):
+        """Test loading falls back to the stdlib parser when orjson is unavailable."""
+        monkeypatch.setattr("src.orchestration.step_functions.orjson", None)
+        definition_file = tmp_path / "test_definition.json"
+        definition_file.write_text(STATE_MACHINE_DEFINITION_JSON)
+
+        result = StepFunctionsHandler.load_state_machine_definition(str(definition_file))
+
+        assert result == STATE_MACHINE_DEFINITION
+
     def test_substitute_variables_success(self, step_functions_handler):
         """Test substituting variables in definition."""
         definition = {
@@ -572,6 +578,28 @@ class TestStateMachineDefinitionHelpers:
 
         assert result["Comment"] == "Value1 and ${Env2}"
 
+    def test_substitute_variables_punctuated_names(self, step_functions_handler):
+        """Test names containing hyphens, dots and colons are substituted."""
+        definition = {
+            "Comment": "${bucket-name}/${app.env}/${aws:region}",
+            "States": {"Test": {"Type": "Pass", "End": True}},
+        }
+
+        variables = {"bucket-name": "my-bucket", "app.env": "prod", "aws:region": "us-east-1"}
+
+        result = step_functions_handler.substitute_variables(definition, variables)
+
+        assert result["Comment"] == "my-bucket/prod/us-east-1"
+
+    def test_substitute_variables_value_needing_json_escape(self, step_functions_handler):
+        """Test values with quotes are substituted verbatim and the input is left intact."""
+        definition = {"Comment": "${Note}", "States": {"Test": {"Type": "Pass", "End": True}}}
+
+        result = step_functions_handler.substitute_variables(definition, {"Note": 'say "hi"'})
+
+        assert result["Comment"] == 'say "hi"'
+        assert definition["Comment"] == "${Note}"
+
 
 class TestIntegration:
     """Integration tests for Step Functions workflow."""
@@ -4,7 +4,81 @@
 import os
 import sys
 import zipfile
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
+from typing import Iterable, Iterator, Optional, Tuple
+
+# Already-compressed formats gain nothing from deflate, so they are stored as-is
+STORED_SUFFIXES = {'.gz', '.bz2', '.xz', '.zip', '.whl', '.jar', '.png', '.jpg', '.jpeg'}
+
+# Level 1 trades a slightly larger archive for much faster builds
+COMPRESS_LEVEL = 1
+
+# AWS limit for a directly uploaded Lambda layer zip
+MAX_LAYER_SIZE_MB = 50
+
+# Files at or above this size are streamed from disk instead of read ahead
+LARGE_FILE_BYTES = 1024 * 1024
+
+# Reads allowed in flight ahead of the writer; with LARGE_FILE_BYTES this caps
+# read-ahead memory at READ_AHEAD MiB
+READ_AHEAD = 2 * (os.cpu_count() or 1)
+
+
+def _iter_files(directory: str) -> Iterator[str]:
+    """Yield every file path under a directory using os.scandir.
+
+    Symlinked directories are not descended into, matching os.walk.
+
+    Args:
+        directory: Directory to traverse
+    """
+    stack = [directory]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path
+
+
+def _read_small_file(file_path: str) -> Optional[bytes]:
+    """Read a file's contents on a worker thread, or return None if it is large.
+
+    Args:
+        file_path: File to read
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size >= LARGE_FILE_BYTES:
+            return None
+        return f.read()
+
+
+def _read_ahead(
+    executor: Executor, file_paths: Iterable[str], window: int
+) -> Iterator[Tuple[str, Optional[bytes]]]:
+    """Yield (path, contents) in order, keeping at most `window` reads in flight.
+
+    A new read is submitted only as an earlier one is consumed, so a slow writer
+    applies backpressure instead of letting file contents pile up in memory.
+
+    Args:
+        executor: Executor the reads run on
+        file_paths: Files to read, in archive order
+        window: Maximum number of reads submitted but not yet consumed
+    """
+    paths = iter(file_paths)
+    pending = deque(
+        (path, executor.submit(_read_small_file, path)) for path in islice(paths, window)
+    )
+    while pending:
+        file_path, future = pending.popleft()
+        for next_path in islice(paths, 1):
+            pending.append((next_path, executor.submit(_read_small_file, next_path)))
+        yield file_path, future.result()
 
 
 def create_zip(source_dir: str, output_file: str) -> None:
@@ -24,13 +98,44 @@ def create_zip(source_dir: str, output_file: str) -> None:
     # Create parent directory if it doesn't exist
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Create zip file
-    with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(source_path):
-            for file in files:
-                file_path = Path(root) / file
-                arcname = file_path.relative_to(source_path.parent)
-                zipf.write(file_path, arcname)
+    # Archive names are relative to the source's parent; slicing off that prefix
+    # avoids building a Path and calling relative_to() for every file
+    prefix = os.path.join(str(source_path.parent), '')
+    file_paths = sorted(_iter_files(prefix + source_path.name))
+
+    # Worker threads read a bounded window of small files ahead while the main
+    # thread compresses; zlib releases the GIL, so reading and deflating overlap. Large files
+    # (wheels, native libraries) are streamed so they are never held in memory.
+    max_bytes = MAX_LAYER_SIZE_MB * 1024 * 1024
+    exceeded = False
+    with ThreadPoolExecutor() as executor, zipfile.ZipFile(
+        output_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=COMPRESS_LEVEL
+    ) as zipf:
+        for file_path, data in _read_ahead(executor, file_paths, READ_AHEAD):
+            arcname = file_path[len(prefix):]
+            if os.path.splitext(file_path)[1].lower() in STORED_SUFFIXES:
+                compress_type = zipfile.ZIP_STORED
+            else:
+                compress_type = zipfile.ZIP_DEFLATED
+
+            if data is None:
+                zipf.write(file_path, arcname, compress_type=compress_type)
+            else:
+                zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+                zipf.writestr(
+                    zinfo, data, compress_type=compress_type, compresslevel=COMPRESS_LEVEL
+                )
+
+            # Stop as soon as the archive is over the limit instead of finishing it
+            if zipf.fp.tell() > max_bytes:
+                exceeded = True
+                executor.shutdown(wait=False, cancel_futures=True)
+                break
+
+    if exceeded:
+        output_path.unlink()
+        print(f"WARNING: Layer size exceeds AWS limit ({MAX_LAYER_SIZE_MB} MB); aborted")
+        sys.exit(1)
 
     # Get file size
     size_bytes = output_path.stat().st_size
@@ -39,8 +144,8 @@ def create_zip(source_dir: str, output_file: str) -> None:
     print(f"Created: {output_path}")
     print(f"Size: {size_mb:.2f} MB")
 
-    if size_mb > 50:
-        print(f"WARNING: Layer size ({size_mb:.2f} MB) exceeds AWS limit (50 MB)")
+    if size_mb > MAX_LAYER_SIZE_MB:
+        print(f"WARNING: Layer size ({size_mb:.2f} MB) exceeds AWS limit ({MAX_LAYER_SIZE_MB} MB)")
         sys.exit(1)
 
 